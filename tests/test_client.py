@@ -1,6 +1,20 @@
 import asyncio
-from functools import partial
-from typing import Any, Awaitable, Callable, Mapping, Optional, Protocol, Union
+import itertools
+import pathlib
+import ssl
+import time
+from types import SimpleNamespace
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
 import aiohttp
@@ -8,28 +22,63 @@ import pytest
 import requests
 
 from zucker import AioClient, RequestsClient, SugarError, model
-from zucker.client import AsyncClient, SyncClient
-from zucker.utils import JsonMapping, JsonType
+from zucker.client import FileTokenStore, SyncClient, TokenOrigin
+from zucker.exceptions import InvalidSugarResponseError
+from zucker.utils import (
+    JsonMapping,
+    JsonType,
+    _find_json_implementation,
+    dump_json,
+    load_json,
+)
+
+# Tokens handed out by the fake server only need to differ from each other, so they are
+# drawn from a pool instead of generating a new UUID for every response.
+_TOKENS = itertools.cycle([uuid4().hex for _ in range(64)])
 
 
 class MockResponse:
+    json: Callable[..., Union[JsonType, Awaitable[JsonType]]]
+
     def __init__(self, data: JsonType, status_code: int = 200):
         self.data = data
         self.status_code = status_code
 
+        # Responses are created inside the request handler, so whether an event loop
+        # is running here tells us which client the response is meant for. The
+        # matching json() variant is picked once so that calls don't need to check.
+        try:
+            asyncio.get_running_loop()
+            self.json = self.async_json
+        except RuntimeError:
+            self.json = self.sync_json
+
     @property
     def ok(self) -> bool:
         return self.status_code < 400
 
-    async def async_json(self) -> JsonType:
+    @property
+    def status(self) -> int:
+        return self.status_code
+
+    @property
+    def content(self) -> bytes:
+        return dump_json(self.data).encode()
+
+    async def __aenter__(self) -> "MockResponse":
+        # Yield to the event loop like a real response would, so that concurrent
+        # requests actually interleave.
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def sync_json(self) -> JsonType:
         return self.data
 
-    def json(self) -> Union[JsonType, Awaitable[JsonType]]:
-        try:
-            asyncio.get_running_loop()
-            return self.async_json()
-        except RuntimeError:
-            return self.data
+    async def async_json(self, **kwargs: Any) -> JsonType:
+        return self.data
 
 
 class HandlerType(Protocol):
@@ -59,8 +108,11 @@ def fake_server(monkeypatch: pytest.MonkeyPatch) -> FakeServer:
     def fake_request(
         self: Any, request_method: str, path: str, **kwargs: Any
     ) -> MockResponse:
-        kwargs.setdefault("headers", {})
-        kwargs.setdefault("data", {})
+        # Clients pass None for arguments they don't use.
+        if kwargs.get("headers") is None:
+            kwargs["headers"] = {}
+        if kwargs.get("data") is None:
+            kwargs["data"] = {}
 
         if handler is None:
             raise RuntimeError(
@@ -73,21 +125,26 @@ def fake_server(monkeypatch: pytest.MonkeyPatch) -> FakeServer:
         if result is not None:
             return result
         else:
-            raise RuntimeError(f"requesting non-mocked path: {path!r} ({method})")
+            raise RuntimeError(
+                f"requesting non-mocked path: {path!r} ({request_method})"
+            )
 
-    async def async_fake_request(
+    # aiohttp's request() isn't awaited directly but used as an asynchronous context
+    # manager, which MockResponse supports.
+    def async_fake_request(
         self: Any, request_method: str, path: str, **kwargs: Any
     ) -> MockResponse:
         return fake_request(None, request_method, path, **kwargs)
 
+    # Both clients go through their session objects, so patching the module-level
+    # requests.get() and requests.post() shortcuts isn't necessary.
     monkeypatch.setattr(requests.Session, "request", fake_request)
-    for method in ("get", "post"):
-        monkeypatch.setattr(requests, method, partial(fake_request, method))
     monkeypatch.setattr(aiohttp.ClientSession, "request", async_fake_request)
 
     return set_handler
 
 
+# This fixture stays function-scoped because tests store metadata on the client.
 @pytest.fixture
 def authenticated_sync_client(monkeypatch: pytest.MonkeyPatch) -> SyncClient:
     client = RequestsClient("http://base", "user", "pass")
@@ -100,18 +157,6 @@ def authenticated_sync_client(monkeypatch: pytest.MonkeyPatch) -> SyncClient:
     return client
 
 
-@pytest.fixture
-def authenticated_async_client(monkeypatch: pytest.MonkeyPatch) -> AsyncClient:
-    client = AioClient("http://base", "user", "pass")
-
-    def fake_authentication_payload() -> None:
-        return None
-
-    monkeypatch.setattr(client, "_prepare_authentication", fake_authentication_payload)
-
-    return client
-
-
 def test_missing_parameters() -> None:
     with pytest.raises(ValueError):
         RequestsClient("http://base", "user", "")
@@ -125,6 +170,40 @@ def test_authentication_and_request(fake_server: FakeServer) -> None:
     access_token = None
     refresh_token = None
 
+    def handle_token(data: JsonMapping) -> MockResponse:
+        nonlocal access_token, refresh_token
+        assert data["client_id"] == "sugar"
+        assert data["platform"] == "testplatform"
+        if data["grant_type"] == "password":
+            assert data["username"] == "testuser"
+            assert data["password"] == "testpassword"
+        elif data["grant_type"] == "refresh_token":
+            assert data["refresh_token"] == refresh_token
+
+        access_token = next(_TOKENS)
+        refresh_token = next(_TOKENS)
+        return MockResponse(
+            {
+                "access_token": access_token,
+                "expires_in": 10,
+                "token_type": "bearer",
+                "scope": None,
+                "refresh_token": refresh_token,
+                "refresh_expires_in": 1209600,
+                "download_token": next(_TOKENS),
+            }
+        )
+
+    routes: Mapping[Tuple[str, str], Callable[[JsonMapping], MockResponse]] = {
+        ("post", "http://base/rest/v11_5/oauth2/token/"): handle_token,
+        ("get", "http://base/rest/v11_5/notaroute"): (
+            lambda data: MockResponse({"ping": "pong"})
+        ),
+        ("get", "http://base/rest/v11_5/errorroute"): (
+            lambda data: MockResponse({"error_message": "theerror"}, 500)
+        ),
+    }
+
     def handle_request(
         method: str,
         path: str,
@@ -132,41 +211,14 @@ def test_authentication_and_request(fake_server: FakeServer) -> None:
         headers: JsonMapping,
         **kwargs: Any,
     ) -> Optional[MockResponse]:
-        nonlocal access_token, refresh_token
         assert isinstance(data, Mapping)
 
-        if method == "post" and path == "http://base/rest/v11_5/oauth2/token/":
-            assert data["client_id"] == "sugar"
-            assert data["platform"] == "testplatform"
-            if data["grant_type"] == "password":
-                assert data["username"] == "testuser"
-                assert data["password"] == "testpassword"
-            elif data["grant_type"] == "refresh_token":
-                assert data["refresh_token"] == refresh_token
-
-            access_token = str(uuid4())
-            refresh_token = str(uuid4())
-            return MockResponse(
-                {
-                    "access_token": access_token,
-                    "expires_in": 10,
-                    "token_type": "bearer",
-                    "scope": None,
-                    "refresh_token": refresh_token,
-                    "refresh_expires_in": 1209600,
-                    "download_token": str(uuid4()),
-                }
-            )
-
-        assert access_token is not None and headers["OAuth-Token"] == access_token
-
-        if method == "get" and path == "http://base/rest/v11_5/notaroute":
-            return MockResponse({"ping": "pong"})
-
-        elif method == "get" and path == "http://base/rest/v11_5/errorroute":
-            return MockResponse({"error_message": "theerror"}, 500)
-
-        return None
+        route = routes.get((method, path))
+        if route is None:
+            return None
+        if route is not handle_token:
+            assert access_token is not None and headers["OAuth-Token"] == access_token
+        return route(data)
 
     fake_server(handle_request)
 
@@ -192,9 +244,12 @@ def test_metadata(
     server_flavor = "PRO"
     server_version = "9.0.1"
     server_build = "176"
+    metadata_requests = 0
 
     def handle_request(method: str, path: str, **kwargs: Any) -> Optional[MockResponse]:
+        nonlocal metadata_requests
         if method == "get" and path == "http://base/rest/v11_5/metadata":
+            metadata_requests += 1
             return MockResponse(
                 {
                     "server_info": {
@@ -209,9 +264,9 @@ def test_metadata(
                         "A": "A",
                         "B": "B",
                         "C": "C",
-                        "_hash": str(uuid4()),
+                        "_hash": "h",
                     },
-                    "_hash": str(uuid4()),
+                    "_hash": "h",
                 }
             )
 
@@ -220,6 +275,11 @@ def test_metadata(
     fake_server(handle_request)
     client = authenticated_sync_client
     client.fetch_metadata("server_info", "full_module_list")
+    assert metadata_requests == 1
+
+    # Types that are already available aren't requested again.
+    client.fetch_metadata("full_module_list")
+    assert metadata_requests == 1
 
     assert client.server_info == (server_flavor, server_version, server_build)
 
@@ -229,3 +289,321 @@ def test_metadata(
     assert "A" in client
     assert A in client
     assert list(client.module_names) == ["A", "B", "C"]
+
+
+def test_json_body(
+    authenticated_sync_client: SyncClient, fake_server: FakeServer
+) -> None:
+    def handle_request(
+        method: str, path: str, data: Any, headers: JsonMapping, **kwargs: Any
+    ) -> Optional[MockResponse]:
+        if (method, path) == ("post", "http://base/rest/v11_5/echo"):
+            # JSON bodies arrive already encoded.
+            assert isinstance(data, bytes)
+            assert headers["Content-Type"] == "application/json"
+            return MockResponse({"echo": load_json(data)})
+        return None
+
+    fake_server(handle_request)
+    payload = {"name": "Ümlaut", "values": [1, 2.5, None]}
+    response = authenticated_sync_client.request("post", "echo", json=payload)
+    assert response == {"echo": payload}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_implementations(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+
+        def import_module(name: str) -> Any:
+            raise ImportError(name)
+
+        monkeypatch.setattr("importlib.import_module", import_module)
+    dumps, dumps_bytes, loads = _find_json_implementation()
+
+    value = {"name": "Ümlaut", "values": [1, 2.5, None, 2**70]}
+    assert loads(dumps(value)) == value
+    assert loads(dumps_bytes(value)) == value
+    # Non-string keys aren't valid according to the types, but still work.
+    non_str_keys = {1: True, None: False}
+    assert loads(dumps(non_str_keys)) == {"1": True, "null": False}  # type: ignore
+    for invalid_value in (float("nan"), [float("inf")], {"a": -float("inf")}):
+        with pytest.raises(ValueError):
+            dumps(invalid_value)
+    for invalid_document in (b"NaN", b"[Infinity]", b'{"a": -Infinity}'):
+        with pytest.raises(ValueError):
+            loads(invalid_document)
+
+
+@pytest.mark.parametrize("verify_ssl", [True, False])
+def test_requests_ssl_verification(
+    fake_server: FakeServer, monkeypatch: pytest.MonkeyPatch, verify_ssl: bool
+) -> None:
+    verify_settings: List[Any] = []
+
+    def handle_request(method: str, path: str, **kwargs: Any) -> MockResponse:
+        verify_settings.append(kwargs.get("verify"))
+        return MockResponse({})
+
+    fake_server(handle_request)
+    # requests would let this override a verification setting on the session.
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/path/to/bundle.pem")
+    client = RequestsClient("http://base", "user", "pass", verify_ssl=verify_ssl)
+    client.raw_request("get", "ping")
+    assert verify_settings == [verify_ssl]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_authentication(fake_server: FakeServer) -> None:
+    token_requests = 0
+
+    def handle_request(method: str, path: str, **kwargs: Any) -> Optional[MockResponse]:
+        nonlocal token_requests
+        if (method, path) == ("post", "http://base/rest/v11_5/oauth2/token/"):
+            token_requests += 1
+            return MockResponse(
+                {
+                    "access_token": next(_TOKENS),
+                    "expires_in": 3600,
+                    "refresh_token": next(_TOKENS),
+                }
+            )
+        elif (method, path) == ("get", "http://base/rest/v11_5/ping"):
+            return MockResponse({"ping": "pong"})
+        return None
+
+    fake_server(handle_request)
+
+    client = AioClient("http://base", "user", "pass")
+    try:
+        results = await asyncio.gather(
+            *(client.request("get", "ping") for _ in range(3))
+        )
+    finally:
+        await client.close()
+    assert [result["ping"] for result in results] == ["pong"] * 3
+    assert token_requests == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("verify_ssl", [True, False])
+async def test_aiohttp_ssl_verification(
+    fake_server: FakeServer, verify_ssl: bool
+) -> None:
+    fake_server(lambda method, path, **kwargs: MockResponse({}))
+
+    client = AioClient("http://base", "user", "pass", verify_ssl=verify_ssl)
+    try:
+        await client.raw_request("get", "ping")
+        assert client._session is not None
+        connector = client._session.connector
+        assert connector is not None
+        ssl_setting = getattr(connector, "_ssl")
+    finally:
+        await client.close()
+
+    if verify_ssl:
+        assert isinstance(ssl_setting, ssl.SSLContext)
+        assert ssl_setting.verify_mode == ssl.CERT_REQUIRED
+        assert ssl_setting.check_hostname
+    else:
+        assert ssl_setting is False
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_connection_limits(fake_server: FakeServer) -> None:
+    fake_server(lambda method, path, **kwargs: MockResponse({}))
+
+    for client, limit, limit_per_host in (
+        (AioClient("http://base", "user", "pass"), 64, 16),
+        (
+            AioClient(
+                "http://base",
+                "user",
+                "pass",
+                connection_limit=0,
+                connection_limit_per_host=0,
+            ),
+            0,
+            0,
+        ),
+    ):
+        try:
+            await client.raw_request("get", "ping")
+            assert client._session is not None
+            connector = client._session.connector
+            assert connector is not None
+            assert connector.limit == limit
+            assert connector.limit_per_host == limit_per_host
+        finally:
+            await client.close()
+
+
+def test_metadata_ttl(fake_server: FakeServer, monkeypatch: pytest.MonkeyPatch) -> None:
+    metadata_requests = 0
+
+    def handle_request(method: str, path: str, **kwargs: Any) -> Optional[MockResponse]:
+        nonlocal metadata_requests
+        if (method, path) == ("post", "http://base/rest/v11_5/oauth2/token/"):
+            return MockResponse(
+                {
+                    "access_token": next(_TOKENS),
+                    "expires_in": 3600,
+                    "refresh_token": next(_TOKENS),
+                }
+            )
+        elif (method, path) == ("get", "http://base/rest/v11_5/metadata"):
+            metadata_requests += 1
+            module_name = "A" if metadata_requests == 1 else "B"
+            return MockResponse({"full_module_list": {module_name: module_name}})
+        return None
+
+    fake_server(handle_request)
+    now = 1000.0
+    # Only the client module's view of the clock is replaced.
+    monkeypatch.setattr(
+        "zucker.client.base.time", SimpleNamespace(monotonic=lambda: now)
+    )
+
+    client = RequestsClient("http://base", "user", "pass", metadata_ttl=60)
+    client.fetch_metadata("full_module_list")
+    now += 30
+    client.fetch_metadata("full_module_list")
+    assert metadata_requests == 1
+    assert list(client.module_names) == ["A"]
+
+    now += 31
+    client.fetch_metadata("full_module_list")
+    assert metadata_requests == 2
+    # Values derived from the old metadata must not be reused.
+    assert list(client.module_names) == ["B"]
+    assert "B" in client and "A" not in client
+
+
+def test_response_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = RequestsClient("http://base", "user", "pass")
+    invalid_response: Any = {"records": [{1: "not a string key"}]}
+
+    # Decoded dictionaries are trusted by default...
+    assert client._finalize_request(200, invalid_response) is invalid_response
+    with pytest.raises(InvalidSugarResponseError):
+        client._finalize_request(200, ["not", "a", "mapping"])
+
+    # ...unless strict validation is enabled.
+    monkeypatch.setattr(RequestsClient, "_STRICT_JSON_VALIDATION", True)
+    with pytest.raises(InvalidSugarResponseError):
+        client._finalize_request(200, invalid_response)
+
+
+def test_token_store(
+    fake_server: FakeServer, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    token_requests: List[str] = []
+
+    def handle_request(
+        method: str, path: str, data: JsonType, **kwargs: Any
+    ) -> Optional[MockResponse]:
+        if (method, path) == ("post", "http://base/rest/v11_5/oauth2/token/"):
+            assert isinstance(data, Mapping) and isinstance(data["grant_type"], str)
+            token_requests.append(data["grant_type"])
+            if data.get("refresh_token") == "revoked":
+                return MockResponse({"error": "invalid_grant"}, 400)
+            return MockResponse(
+                {
+                    "access_token": next(_TOKENS),
+                    "expires_in": 3600,
+                    "refresh_token": next(_TOKENS),
+                }
+            )
+        elif (method, path) == ("get", "http://base/rest/v11_5/ping"):
+            return MockResponse({"ping": "pong"})
+        return None
+
+    fake_server(handle_request)
+    store = FileTokenStore(tmp_path / "tokens.json")
+    origin = TokenOrigin("http://base", "user", "zucker")
+    assert store.load(origin) is None
+
+    client = RequestsClient("http://base", "user", "pass", token_store=store)
+    client.request("get", "ping")
+    assert token_requests == ["password"]
+    assert (tmp_path / "tokens.json").stat().st_mode & 0o777 == 0o600
+
+    # A second client picks up the saved tokens and doesn't need to log in again.
+    client = RequestsClient("http://base", "user", "pass", token_store=store)
+    assert client.authenticated
+    client.request("get", "ping")
+    assert token_requests == ["password"]
+
+    # Tokens are never handed to clients for another user, server or platform.
+    for other_client in (
+        RequestsClient("http://base", "other", "pass", token_store=store),
+        RequestsClient("http://other", "user", "pass", token_store=store),
+        RequestsClient(
+            "http://base", "user", "pass", client_platform="other", token_store=store
+        ),
+    ):
+        assert not other_client.authenticated
+    store.save(TokenOrigin("http://other", "user", "zucker"), "a", "b", time.time())
+    stored_tokens = store.load(origin)
+    assert stored_tokens is not None and stored_tokens[0] != "a"
+
+    # When the stored access token has expired, the refresh token is used.
+    store.save(origin, stored_tokens[0], stored_tokens[1], time.time() - 1)
+    client = RequestsClient("http://base", "user", "pass", token_store=store)
+    assert not client.authenticated
+    client.request("get", "ping")
+    assert token_requests == ["password", "refresh_token"]
+
+    # If that doesn't work either, the client logs in again.
+    token_requests.clear()
+    store.save(origin, "expired", "revoked", time.time() - 1)
+    client = RequestsClient("http://base", "user", "pass", token_store=store)
+    client.request("get", "ping")
+    assert token_requests == ["refresh_token", "password"]
+    stored_tokens = store.load(origin)
+    assert stored_tokens is not None and stored_tokens[1] != "revoked"
+
+    # Saving replaces the file, so existing broader permissions are not kept.
+    (tmp_path / "tokens.json").chmod(0o644)
+    store.save(origin, "access", "refresh", time.time() + 3600)
+    assert (tmp_path / "tokens.json").stat().st_mode & 0o777 == 0o600
+    assert store.load(origin) is not None
+    assert [path.name for path in tmp_path.iterdir()] == ["tokens.json"]
+
+    # The temporary file is removed again if writing fails.
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("zucker.client.tokens.open", fail, raising=False)
+        with pytest.raises(OSError):
+            store.save(origin, "other", "other", time.time() + 3600)
+    assert [path.name for path in tmp_path.iterdir()] == ["tokens.json"]
+    stored_tokens = store.load(origin)
+    assert stored_tokens is not None and stored_tokens[0] == "access"
+
+
+def test_token_renewal_margin(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr(
+        "zucker.client.base.time", SimpleNamespace(monotonic=lambda: now)
+    )
+    client = RequestsClient("http://base", "user", "pass")
+
+    # Long-lived tokens are renewed ten minutes before they expire...
+    client._set_authentication("access", "refresh", 3600)
+    now += 2999
+    assert client._prepare_authentication() is None
+    now += 1
+    assert client._prepare_authentication() is not None
+
+    # ...and short-lived ones after half of their lifetime.
+    client._set_authentication("access", "refresh", 600)
+    now += 299
+    assert client._prepare_authentication() is None
+    now += 1
+    assert client._prepare_authentication() is not None
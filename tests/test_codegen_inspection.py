@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from hypothesis import given
 from hypothesis import strategies as st
@@ -6,6 +6,7 @@ from hypothesis import strategies as st
 from zucker import model
 from zucker.codegen.inspection import (
     FieldInspectionContext,
+    FieldMetadataRegistry,
     InspectedField,
     InspectedModule,
     field_for_metadata,
@@ -14,19 +15,24 @@ from zucker.codegen.inspection import (
 from zucker.codegen.interactive.inspect import indent
 from zucker.utils import MutableJsonMapping
 
-
-@st.composite
-def field_names(
-    # When running this on Python 3.8 we are on a Hypothesis version that doesn't expose
-    # DrawFn yet, hence this needs to be a string. Mypy runs with the latest dependency
-    # versions so that isn't a problem.
-    draw: "st.DrawFn",
-) -> str:
-    return draw(st.text(min_size=1))
+# Strategies are immutable, so they are built once here instead of inside each of the
+# composite strategies below. Field names that are mapped to dedicated field types
+# (regardless of the rest of their metadata) are left out.
+_FIELD_NAME = st.text(min_size=1).filter(
+    lambda name: name not in ("id", "email1", "email2")
+)
+_TEXT = st.text()
+_BOOL = st.booleans()
+_ROWS_COLS = st.tuples(st.integers(1, 8), st.integers(20, 100))
+_SUGAR_TYPE = st.sampled_from(("text", "varchar"))
+_LENGTH = st.integers(20, 300)
 
 
 def augment_field_data(
     *,
+    # When running this on Python 3.8 we are on a Hypothesis version that doesn't expose
+    # DrawFn yet, hence this needs to be a string. Mypy runs with the latest dependency
+    # versions so that isn't a problem.
     draw: "st.DrawFn",
     arguments: MutableJsonMapping,
     raw_metadata: MutableJsonMapping,
@@ -41,17 +47,17 @@ def augment_field_data(
     """
     arguments["api_name"] = name
     raw_metadata["name"] = name
-    raw_metadata["help"] = draw(st.text())
-    raw_metadata["comment"] = draw(st.text())
-    raw_metadata["comments"] = draw(st.text())
-    raw_metadata["audited"] = draw(st.booleans())
+    raw_metadata["help"] = draw(_TEXT)
+    raw_metadata["comment"] = draw(_TEXT)
+    raw_metadata["comments"] = draw(_TEXT)
+    raw_metadata["audited"] = draw(_BOOL)
 
 
 @st.composite
 def inspected_boolean_fields(draw: "st.DrawFn") -> InspectedField:
-    name = draw(field_names())
+    name = draw(_FIELD_NAME)
     arguments: MutableJsonMapping = {}
-    raw_metadata: MutableJsonMapping = {"type": "bool", "default": draw(st.booleans())}
+    raw_metadata: MutableJsonMapping = {"type": "bool", "default": draw(_BOOL)}
 
     augment_field_data(**locals())
 
@@ -65,16 +71,16 @@ def inspected_boolean_fields(draw: "st.DrawFn") -> InspectedField:
 
 @st.composite
 def inspected_string_fields(draw: "st.DrawFn") -> InspectedField:
-    name = draw(field_names())
-    sugar_type = draw(st.sampled_from(("text", "varchar")))
+    name = draw(_FIELD_NAME)
+    sugar_type = draw(_SUGAR_TYPE)
     arguments: MutableJsonMapping = {}
     raw_metadata: MutableJsonMapping = dict(name=name, type=sugar_type)
 
     if sugar_type == "text":
-        rows, cols = draw(st.tuples(st.integers(1, 8), st.integers(20, 100)))
+        rows, cols = draw(_ROWS_COLS)
         raw_metadata.update(rows=rows, cols=cols)
     elif sugar_type == "varchar":
-        length = draw(st.integers(20, 300))
+        length = draw(_LENGTH)
         raw_metadata["length"] = length
 
     augment_field_data(**locals())
@@ -94,7 +100,7 @@ def inspected_scalar_fields(draw: "st.DrawFn") -> InspectedField:
 
 @st.composite
 def inspected_modules(draw: "st.DrawFn") -> InspectedModule:
-    name = draw(field_names())
+    name = draw(_FIELD_NAME)
 
     def get_field_name(inspected_field: InspectedField) -> str:
         return inspected_field.name
@@ -113,11 +119,13 @@ def inspected_modules(draw: "st.DrawFn") -> InspectedModule:
 
 @given(st.lists(st.text()))
 def test_indenting(lines: List[str]) -> None:
-    all_lines = "\n".join(lines).split("\n")
+    joined = "\n".join(lines)
+    all_lines = joined.split("\n")
     for steps in range(0, 10):
-        expected_result = "\n".join("  " * steps + line for line in all_lines)
+        prefix = "  " * steps
+        expected_result = "\n".join(prefix + line for line in all_lines)
         assert indent(lines, steps) == expected_result
-        assert indent("\n".join(lines), steps) == expected_result
+        assert indent(joined, steps) == expected_result
 
 
 @given(inspected_scalar_fields())
@@ -148,3 +156,43 @@ def test_module_inspection(module: InspectedModule) -> None:
     assert len(inspection_result) == 1
     inspected_module = inspection_result[0]
     assert inspected_module == module
+
+
+def test_registry_order() -> None:
+    registry = FieldMetadataRegistry()
+    registry.register(metadata_attributes=dict(name="special"))(model.BooleanField)
+    registry.register(metadata_attributes=dict(type="varchar"))(model.StringField)
+    registry.register(metadata_attributes=dict(type="bool"))(model.BooleanField)
+    assert len(registry.field_initializers) == 3
+
+    def resolve(**field_metadata: str) -> Optional[type]:
+        context = FieldInspectionContext(
+            module_name="Module",
+            field_name="field",
+            field_metadata=field_metadata,
+            modules={},
+            client=None,  # type: ignore
+        )
+        result = registry(context)
+        return None if result is None else result[0]
+
+    # Initializers that don't depend on the field type still take precedence when
+    # they were registered first.
+    assert resolve(name="special", type="varchar") is model.BooleanField
+    assert resolve(name="other", type="varchar") is model.StringField
+    assert resolve(name="other", type="bool") is model.BooleanField
+    assert resolve(name="other", type="unknown") is None
+    assert resolve(name="special") is model.BooleanField
+    assert resolve(name="other") is None
+
+    # Registering another field type must be picked up for already-seen types.
+    registry.register(metadata_attributes=dict(type="unknown"))(model.StringField)
+    assert resolve(name="other", type="unknown") is model.StringField
+
+    # Initializers may also be added to (or removed from) the list directly.
+    registry.field_initializers.insert(0, lambda context: (model.IntegerField, {}))
+    assert resolve(name="other", type="varchar") is model.IntegerField
+    assert resolve(name="other") is model.IntegerField
+    registry.field_initializers = registry.field_initializers[1:]
+    assert resolve(name="other", type="varchar") is model.StringField
+    assert resolve(name="other") is None
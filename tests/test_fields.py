@@ -1,6 +1,4 @@
 import pytest
-from hypothesis import given
-from hypothesis import strategies as st
 
 from zucker import RequestsClient
 from zucker.client import SyncClient
@@ -15,7 +13,7 @@ from zucker.model.fields.base import AnyModule, MutableField
 from zucker.model.view import SyncView
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> SyncClient:
     return RequestsClient("localhost", "u", "p")
 
@@ -57,12 +55,12 @@ def test_getting_and_setting(client: SyncClient) -> None:
     record.something = "raspberry"
 
 
-@given(st.text())
+@pytest.mark.parametrize("raw_value", ["", "a", "unicode ✓", "\n\t", "x" * 1000])
 def test_string_field_values(raw_value: str) -> None:
     assert StringField.serialize(StringField.load_value(raw_value)) == raw_value
 
 
-@given(st.booleans())
+@pytest.mark.parametrize("raw_value", [True, False])
 def test_boolean_field_values(raw_value: bool) -> None:
     assert BooleanField.serialize(BooleanField.load_value(raw_value)) == raw_value
 
@@ -1,9 +1,12 @@
+import datetime
+import uuid
 from typing import Any, Literal, Optional, Union
 
 import pytest
 
 from zucker.filtering import BasicFilter, Combinator, FilterSet
 from zucker.filtering.combining import FilterOrMapping
+from zucker.model import StringField
 from zucker.model.fields.base import ScalarField
 from zucker.utils import JsonMapping, JsonType, MutableJsonMapping
 
@@ -96,6 +99,23 @@ def test_filterset_immutability() -> None:
     DummyFilter.x["c"] = 4
     assert second.build_filter() == {"$and": [{"b": 2}, {"c": 3}]}
 
+    # Changing the output must not affect the set.
+    output: Any = second.build_filter()
+    output["$and"][0]["b"] = 5
+    output["$and"].append({"d": 4})
+    assert second.build_filter() == {"$and": [{"b": 2}, {"c": 3}]}
+
+
+def test_filterset_values() -> None:
+    # Copying the parts must not change the type of any value.
+    identifier = uuid.uuid4()
+    day = datetime.date(2021, 4, 1)
+    nested: Any = {"id": identifier, "date": {"$in": (day,)}, 1: [None, 2.5]}
+    result = fs_or(nested).build_filter()
+    assert result == {"$or": [nested]}
+    assert result["$or"][0]["id"] is identifier  # type: ignore
+    assert result["$or"][0]["date"] == {"$in": (day,)}  # type: ignore
+
 
 class DemoField(ScalarField[Any, Any]):
     def __init__(self, name: str, **kwargs: Any):
@@ -170,3 +190,13 @@ def test_field_combining() -> None:
     assert FilterSet(
         Combinator.AND, (DummyFilter("a", 1) | DummyFilter("b", 2))
     ).build_filter() == {"$or": [{"a": {"$": 1}}, {"b": {"$": 2}}]}
+
+
+def test_string_filters() -> None:
+    field = StringField("name")
+    assert field.starts_with("Ben").build_filter() == {"name": {"$starts": "Ben"}}
+    assert field.ends_with("son").build_filter() == {"name": {"$ends": "son"}}
+    assert field.contains("ers").build_filter() == {"name": {"$contains": "ers"}}
+    assert field.not_empty().build_filter() == {"name": {"$not_empty": ""}}
+    with pytest.raises(ValueError):
+        field.contains("")
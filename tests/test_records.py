@@ -36,6 +36,18 @@ def test_bound_init(client: SyncClient) -> None:
     # TODO Test that each field gets validated successfully.
 
 
+def test_field_names(client: SyncClient) -> None:
+    class Demo(model.SyncModule, BaseDemo, client=client):
+        baz = model.StringField()
+
+    class OtherDemo(Demo, client=client):
+        foo = None  # type: ignore
+
+    assert list(BaseDemo.field_names()) == ["bar", "foo", "id"]
+    assert list(Demo.field_names()) == ["bar", "baz", "foo", "id"]
+    assert list(OtherDemo.field_names()) == ["bar", "baz", "id"]
+
+
 def test_strings(client: SyncClient) -> None:
     class Demo(model.SyncModule, BaseDemo, client=client):
         pass
@@ -7,7 +7,7 @@ from hypothesis import strategies as st
 from zucker.model import IdField
 
 
-@hypothesis.given(st.integers(0, 2**128))
+@hypothesis.given(st.integers(0, 2**128 - 1))
 def test_id_field_loading(value: int) -> None:
     hex_value = hex(value)[2:].zfill(32)
     formatted_uuid = f"{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-{hex_value[16:20]}-{hex_value[20:]}"
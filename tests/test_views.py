@@ -1,20 +1,40 @@
-from typing import Any, Callable, Iterable, List, Optional, Tuple, TypedDict, cast
+import asyncio
+import urllib.parse
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypedDict,
+    cast,
+)
 from uuid import uuid4
 
 import pytest
 
 from zucker import model
-from zucker.client import SyncClient
+from zucker.client import AsyncClient, SyncClient
 from zucker.filtering import Combinator, FilterSet
-from zucker.utils import JsonMapping
+from zucker.model.view import AsyncView, SyncView
+from zucker.utils import JsonMapping, JsonType
 
 FakeClientDataCallback = Callable[[str, str, JsonMapping], Optional[JsonMapping]]
 
+# Shared (read-only) default for requests that don't have any query parameters.
+_EMPTY_PARAMS: JsonMapping = MappingProxyType({})
+
 
 class FakeClient(SyncClient):
     def __init__(self) -> None:
         super().__init__("http://test", "u", "p")
         self.data_callbacks: list[FakeClientDataCallback] = []
+        # Fixed responses from set_data() are looked up directly instead of going
+        # through a callback each.
+        self._static: dict[Tuple[str, str], JsonMapping] = {}
 
     def request(
         self,
@@ -25,8 +45,10 @@ class FakeClient(SyncClient):
         data: Optional[JsonMapping] = None,
         json: Optional[JsonMapping] = None,
     ) -> JsonMapping:
+        if (response := self._static.get((method, url))) is not None:
+            return response
         if params is None:
-            params = {}
+            params = _EMPTY_PARAMS
         for func in self.data_callbacks:
             data = func(method, url, params)
             if data is not None:
@@ -37,19 +59,84 @@ class FakeClient(SyncClient):
         raise RuntimeError("using non-mocked raw_request method")
 
     def set_data(self, method: str, url: str, response: JsonMapping) -> None:
-        def callback(
-            given_method: str, given_url: str, params: JsonMapping
-        ) -> Optional[JsonMapping]:
-            if (method, url) == (given_method, given_url):
-                return response
-            return None
-
-        self.add_data_callback(callback)
+        self._static[(method, url)] = response
 
     def add_data_callback(self, callback: FakeClientDataCallback) -> None:
         self.data_callbacks.append(callback)
 
 
+class FakeAsyncClient(AsyncClient):
+    """Asynchronous counterpart to :class:`FakeClient` that answers requests from
+    the same callbacks."""
+
+    def __init__(self, sync_client: FakeClient) -> None:
+        super().__init__("http://test", "u", "p")
+        self.sync_client = sync_client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[JsonMapping] = None,
+        data: Optional[JsonMapping] = None,
+        json: Optional[JsonMapping] = None,
+        allow_bulk: bool = True,
+    ) -> JsonMapping:
+        return self.sync_client.request(method, url, params=params)
+
+    async def raw_request(self, *args: Any, **kwargs: Any) -> Tuple[int, JsonMapping]:
+        raise RuntimeError("using non-mocked raw_request method")
+
+
+class FakeBulkAsyncClient(AsyncClient):
+    """Asynchronous client that goes through the actual request handling (including
+    bulk batching) and answers the resulting HTTP requests from a :class:`FakeClient`.
+    """
+
+    def __init__(self, sync_client: FakeClient) -> None:
+        super().__init__("http://test", "u", "p")
+        self.sync_client = sync_client
+        # Number of requests in each /bulk call and endpoints that were requested
+        # outside of one.
+        self.bulk_sizes: List[int] = []
+        self.direct_requests: List[str] = []
+
+    async def raw_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Optional[Mapping[str, str]] = None,
+        data: Optional[JsonMapping] = None,
+        json: Optional[JsonMapping] = None,
+    ) -> Tuple[int, JsonType]:
+        if endpoint.startswith("oauth2/token"):
+            return 200, {
+                "access_token": "access",
+                "refresh_token": "refresh",
+                "expires_in": 3600,
+            }
+        if endpoint != "/bulk":
+            self.direct_requests.append(endpoint)
+            return 200, self.sync_client.request(method, endpoint, params=params)
+
+        assert json is not None and isinstance(json["requests"], list)
+        self.bulk_sizes.append(len(json["requests"]))
+        responses: List[JsonType] = []
+        for request in json["requests"]:
+            assert isinstance(request, Mapping) and isinstance(request["url"], str)
+            assert isinstance(request["method"], str)
+            url = urllib.parse.urlsplit(request["url"])
+            contents = self.sync_client.request(
+                request["method"].lower(),
+                url.path[len("/v11_5/") :],
+                params=dict(urllib.parse.parse_qsl(url.query)),
+            )
+            responses.append({"status": 200, "contents": contents})
+        return 200, responses
+
+
 @pytest.fixture
 def fake_client(monkeypatch: pytest.MonkeyPatch) -> FakeClient:
     client = FakeClient()
@@ -116,8 +203,35 @@ def test_len(fake_client: FakeClient) -> None:
     class Demo(model.SyncModule, client=fake_client):
         pass
 
-    fake_client.set_data("get", "Demo/count", {"record_count": 43})
-    assert len(Demo.find()) == 43
+    count_requests = 0
+
+    def handle(method: str, url: str, params: JsonMapping) -> Optional[JsonMapping]:
+        nonlocal count_requests
+        if (method, url) == ("get", "Demo/count"):
+            count_requests += 1
+            return {"record_count": 43}
+        return None
+
+    fake_client.add_data_callback(handle)
+    view = Demo.find()
+    assert len(view) == 43
+    assert count_requests == 1
+
+    # The size is cached on the view and shared with sub-views that use the same
+    # filter.
+    assert len(view) == 43
+    assert len(view[3:]) == 40
+    assert len(view[::-1]) == 43
+    assert count_requests == 1
+
+    # Slices that can't contain anything don't need the size at all.
+    view = Demo.find()
+    for empty_view in (view[5:2], view[2:5:-1], view[-2:-5], view[3:8][4:1]):
+        assert len(empty_view) == 0
+        assert list(empty_view) == []
+        with pytest.raises(IndexError):
+            empty_view[0]
+    assert count_requests == 1
 
 
 def test_getting_id(fake_client: FakeClient) -> None:
@@ -131,7 +245,7 @@ def test_getting_id(fake_client: FakeClient) -> None:
         given_method: str, given_url: str, params: JsonMapping
     ) -> Optional[JsonMapping]:
         if (given_method, given_url) == ("get", "Demo"):
-            assert params["max_num"] == "1"
+            assert params["offset"] == "0"
             assert params["fields"] == "id"
             assert params["filter[0][id][$equals]"] == key
             return {"records": [{"_module": "Demo", "id": key}]}
@@ -157,14 +271,16 @@ def test_getting_offset(fake_client: FakeClient) -> None:
 
     def handle(method: str, url: str, params: JsonMapping) -> Optional[JsonMapping]:
         if (method, url) == ("get", "Demo"):
-            assert params["max_num"] == "1"
             assert isinstance(params["offset"], str) and len(params["offset"]) > 0
-            offset = int(params["offset"])
+            assert isinstance(params["max_num"], str) and len(params["max_num"]) > 0
+            offset, max_num = int(params["offset"]), int(params["max_num"])
             assert offset >= 0
-            if offset > 10:
-                return {"records": []}
-            elif offset == 8:
-                return {"records": [{"_module": "Demo", "id": "eight"}]}
+            return {
+                "records": [
+                    {"_module": "Demo", "id": "eight" if index == 8 else str(index)}
+                    for index in range(offset, min(offset + max_num, 10))
+                ]
+            }
         if (method, url) == ("get", "Demo/count"):
             return {"record_count": 10}
         return None
@@ -253,3 +369,170 @@ def test_iterating_and_slices(fake_client: FakeClient) -> None:
 
     check_records(view, record_data)
     check_records(reversed(view), reversed(record_data))
+
+
+def test_iterating_in_pages(
+    fake_client: FakeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class Demo(model.SyncModule, client=fake_client):
+        pass
+
+    monkeypatch.setattr(SyncView, "_page_size", 5)
+    record_ids = [str(index) for index in range(13)]
+    requested_pages: List[Tuple[int, int]] = []
+    count_requests = 0
+
+    def handle(method: str, url: str, params: JsonMapping) -> Optional[JsonMapping]:
+        if (method, url) == ("get", "Demo"):
+            assert isinstance(params["offset"], str)
+            assert isinstance(params["max_num"], str)
+            offset, max_num = int(params["offset"]), int(params["max_num"])
+            requested_pages.append((offset, max_num))
+            return {
+                "records": [
+                    {"_module": "Demo", "id": record_id}
+                    for record_id in record_ids[offset : offset + max_num]
+                ]
+            }
+        elif (method, url) == ("get", "Demo/count"):
+            nonlocal count_requests
+            count_requests += 1
+            return {"record_count": len(record_ids)}
+        return None
+
+    fake_client.add_data_callback(handle)
+
+    # Forward iteration doesn't need to know the size beforehand. Each page probes for
+    # one extra record and iteration stops once the server returns a short page.
+    view = Demo.find()
+    assert [record.get_data("id") for record in view] == record_ids
+    assert requested_pages == [(0, 6), (5, 6), (10, 6)]
+    assert len(view) == len(record_ids)
+    assert count_requests == 0
+
+    requested_pages.clear()
+    assert [record.get_data("id") for record in Demo.find()[:10]] == record_ids[:10]
+    assert requested_pages == [(0, 6), (5, 6)]
+
+    requested_pages.clear()
+    assert [record.get_data("id") for record in Demo.find()[10:3:-1]] == [
+        str(index) for index in range(10, 3, -1)
+    ]
+    assert requested_pages == [(6, 5), (4, 2)]
+
+    # A view that starts after the last record doesn't reveal the total size, so its
+    # length still needs to be counted.
+    requested_pages.clear()
+    count_requests = 0
+    view = Demo.find()[20:]
+    assert [record for record in view] == []
+    assert requested_pages == [(20, 6)]
+    assert len(view) == 0
+    assert count_requests == 1
+
+    # Once fetched, records are served from the cache.
+    requested_pages.clear()
+    view = Demo.find()
+    list(view)
+    list(view)
+    assert requested_pages == [(0, 5), (5, 5), (10, 3)]
+
+
+@pytest.mark.asyncio
+async def test_async_iterating_in_pages(
+    fake_client: FakeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class Demo(model.AsyncModule, client=FakeAsyncClient(fake_client)):
+        pass
+
+    monkeypatch.setattr(AsyncView, "_page_size", 5)
+    record_ids = [str(index) for index in range(13)]
+    requested_pages: List[Tuple[int, int]] = []
+
+    def handle(method: str, url: str, params: JsonMapping) -> Optional[JsonMapping]:
+        if (method, url) == ("get", "Demo"):
+            assert isinstance(params["offset"], str)
+            assert isinstance(params["max_num"], str)
+            offset, max_num = int(params["offset"]), int(params["max_num"])
+            requested_pages.append((offset, max_num))
+            return {
+                "records": [
+                    {"_module": "Demo", "id": record_id}
+                    for record_id in record_ids[offset : offset + max_num]
+                ]
+            }
+        elif (method, url) == ("get", "Demo/count"):
+            return {"record_count": len(record_ids)}
+        return None
+
+    fake_client.add_data_callback(handle)
+
+    assert [record.get_data("id") async for record in Demo.find()] == record_ids
+    assert requested_pages == [(0, 6), (5, 6), (10, 6)]
+
+    requested_pages.clear()
+    assert [record.get_data("id") async for record in reversed(Demo.find())] == list(
+        reversed(record_ids)
+    )
+    assert requested_pages == [(8, 5), (3, 5), (0, 3)]
+
+    requested_pages.clear()
+    record = await Demo.find()[7]
+    assert record.get_data("id") == "7"
+    assert requested_pages == [(5, 5)]
+
+
+@pytest.mark.asyncio
+async def test_async_iterating_in_bulk(
+    fake_client: FakeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = FakeBulkAsyncClient(fake_client)
+
+    class Demo(model.AsyncModule, client=client):
+        pass
+
+    monkeypatch.setattr(AsyncView, "_page_size", 5)
+    record_ids = [str(index) for index in range(13)]
+
+    def handle(method: str, url: str, params: JsonMapping) -> Optional[JsonMapping]:
+        if (method, url) == ("get", "Demo"):
+            assert isinstance(params["offset"], str)
+            assert isinstance(params["max_num"], str)
+            offset, max_num = int(params["offset"]), int(params["max_num"])
+            return {
+                "records": [
+                    {"_module": "Demo", "id": record_id}
+                    for record_id in record_ids[offset : offset + max_num]
+                ]
+            }
+        return None
+
+    fake_client.add_data_callback(handle)
+
+    async def collect(view: AsyncView[Any]) -> List[str]:
+        return [record.get_data("id") async for record in view]
+
+    # Views with a step fetch their records in batches.
+    assert await collect(Demo.find()[::2]) == record_ids[::2]
+    assert client.bulk_sizes == [5, 5]
+    assert client.direct_requests == []
+
+    # Inside of bulk(), every page request becomes part of the batches.
+    client.bulk_sizes.clear()
+    first, second = await client.bulk(collect(Demo.find()), collect(Demo.find()[1::3]))
+    assert first == record_ids
+    assert second == record_ids[1::3]
+    assert client.direct_requests == []
+    assert sum(client.bulk_sizes) > 0
+
+    async def first_record(view: AsyncView[Any]) -> str:
+        async for record in view:
+            return str(record.get_data("id"))
+        raise AssertionError("view is empty")
+
+    # Stopping early must not leave any requests behind that the bulk call didn't
+    # wait for.
+    assert await client.bulk(first_record(Demo.find())) == ("0",)
+    # This gives the abandoned iterator a chance to be closed.
+    await asyncio.sleep(0)
+    assert asyncio.all_tasks() == {asyncio.current_task()}
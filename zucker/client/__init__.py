@@ -1,3 +1,4 @@
 from .aiohttp import AioClient
 from .base import AsyncClient, BaseClient, SyncClient
 from .requests import RequestsClient
+from .tokens import FileTokenStore, TokenOrigin, TokenStore
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
-from typing import Mapping, Optional, Tuple
+import ssl
+from typing import ClassVar, Mapping, Optional, Tuple, Union
 
-from zucker.utils import JsonMapping, JsonType
+from zucker.utils import JsonMapping, JsonType, dump_json_bytes, load_json
 
 from .base import AsyncClient
+from .tokens import TokenStore
 
 
 class AioClient(AsyncClient):
     """Asynchronous client implementation using `aiohttp`_.
 
+    Connections to the server are pooled and kept alive between requests. By
+    default, at most 16 of them are opened in parallel (aiohttp itself doesn't
+    limit connections to a single host), which also caps how many concurrent
+    requests (for example from :func:`asyncio.gather` or view prefetching) are in
+    flight at the same time. Use the
+    ``connection_limit`` and ``connection_limit_per_host`` parameters to change
+    that - ``0`` means no limit.
+
     .. _aiohttp: https://docs.aiohttp.org/en/latest/index.html
     """
 
+    # Number of seconds that resolved server addresses are cached for.
+    _DNS_CACHE_TTL: ClassVar[int] = 300
+    # Number of seconds that idle connections are kept open for.
+    _KEEPALIVE_TIMEOUT: ClassVar[float] = 60
+
     def __init__(
         self,
         base_url: str,
@@ -21,6 +36,10 @@ class AioClient(AsyncClient):
         *,
         client_platform: str = "zucker",
         verify_ssl: bool = True,
+        metadata_ttl: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
+        connection_limit: int = 64,
+        connection_limit_per_host: int = 16,
     ):
         import aiohttp
 
@@ -30,8 +49,12 @@ class AioClient(AsyncClient):
             password,
             client_platform=client_platform,
             verify_ssl=verify_ssl,
+            metadata_ttl=metadata_ttl,
+            token_store=token_store,
         )
 
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def close(self) -> None:
@@ -48,24 +71,43 @@ class AioClient(AsyncClient):
         data: Optional[JsonMapping] = None,
         json: Optional[JsonMapping] = None,
     ) -> Tuple[int, JsonType]:
-        import aiohttp
-
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            # aiohttp is only needed here (and in __init__, where it is imported to
+            # fail early when it is missing), so the import doesn't run on every call.
+            import aiohttp
+
+            # All requests go to the same server, so the connector is set up to keep
+            # connections (and the resolved address) around for reuse. This way,
+            # parallel requests from bulk() don't each need their own handshake.
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                limit_per_host=self._connection_limit_per_host,
+                ttl_dns_cache=self._DNS_CACHE_TTL,
+                keepalive_timeout=self._KEEPALIVE_TIMEOUT,
+                # Certificate verification is configured once here instead of
+                # being passed along with every request. An explicit context is used
+                # because older aiohttp versions treat any other value that isn't
+                # None as "don't verify" - including True.
+                ssl=ssl.create_default_context() if self._verify_ssl else False,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
             # The following doesn't actually do anything at the moment, but that might
             # change in a future version of aiohttp.
             await self._session.__aenter__()
 
+        headers = self._headers
+        body: Union[None, bytes, JsonMapping] = data
+        if json is not None:
+            # JSON bodies are encoded here with the same (possibly faster) encoder
+            # that is used for decoding responses.
+            headers = self._json_headers
+            body = dump_json_bytes(json)
+
         async with self._session.request(
             method,
-            f"{self.base_url}/rest/v11_5/{endpoint}",
-            headers={
-                "OAuth-Token": self._authentication[1],
-                "Cache-Control": "no-cache",
-            },
-            verify_ssl=self._verify_ssl,
-            params=params or None,
-            data=data or None,
-            json=json or None,
+            self._rest_url + endpoint,
+            headers=headers,
+            params=params,
+            data=body,
         ) as response:
-            return response.status, (await response.json())
+            return response.status, (await response.json(loads=load_json))
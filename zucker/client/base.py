@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import math
+import threading
+import time
 import urllib.parse
-from datetime import datetime, timedelta
-from json import dumps as dump_json
 from typing import (
     TYPE_CHECKING,
     Any,
     Awaitable,
     Callable,
+    ClassVar,
     Coroutine,
+    Dict,
+    FrozenSet,
     Iterator,
     Literal,
     Mapping,
@@ -24,15 +28,24 @@ from typing import (
     overload,
 )
 
+from zucker.client.tokens import TokenOrigin, TokenStore
 from zucker.exceptions import (
     InvalidSugarResponseError,
     SugarError,
     UnfetchedMetadataError,
     ZuckerException,
 )
-from zucker.utils import JsonMapping, JsonType, MutableJsonMapping, is_json_mapping
+from zucker.utils import (
+    JsonMapping,
+    JsonType,
+    MutableJsonMapping,
+    dump_json,
+    is_json_mapping,
+)
 
 if TYPE_CHECKING:
+    from typing import TypeGuard  # noqa: F401
+
     from zucker.model.module import AsyncModule, BoundModule, SyncModule  # noqa: F401
 
 _T = TypeVar("_T")
@@ -44,6 +57,10 @@ _T5 = TypeVar("_T5")
 _T6 = TypeVar("_T6")
 
 
+# Name of the authentication job that renews an expired token from a token store.
+_STORED_TOKEN_RENEWAL = "stored authentication token renewal"
+
+
 class BaseClient(abc.ABC):
     """Connection handler that handles communicating with a SugarCRM instance.
 
@@ -53,6 +70,29 @@ class BaseClient(abc.ABC):
     :class:`~SyncClient` or :class:`~AsyncClient`.
     """
 
+    __slots__ = (
+        "base_url",
+        "_rest_url",
+        "_headers",
+        "_json_headers",
+        "_authentication",
+        "_client_platform",
+        "_verify_ssl",
+        "_metadata",
+        "_module_names",
+        "_module_name_set",
+        "_server_info",
+        "_metadata_ttl",
+        "_metadata_timestamps",
+        "_token_store",
+        "_token_origin",
+        "_stored_refresh_token",
+    )
+
+    # Set this to true to recursively validate every response from the server, even
+    # when it was already decoded into a dictionary.
+    _STRICT_JSON_VALIDATION: ClassVar[bool] = False
+
     def __init__(
         self,
         base_url: str,
@@ -61,11 +101,13 @@ class BaseClient(abc.ABC):
         *,
         client_platform: str = "zucker",
         verify_ssl: bool = True,
+        metadata_ttl: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
     ):
         """Construct a client instance.
 
-        This may take a few seconds, as it performs initial authentication as well as querying
-        the server for metadata about it's configuration.
+        No requests are made here. Authentication happens with the first request and
+        metadata is only fetched when :meth:`fetch_metadata` is called.
 
         :param base_url: The URL of the SugarCRM installation to connect to.
         :param username: Username to authenticate with.
@@ -73,18 +115,34 @@ class BaseClient(abc.ABC):
         :param client_platform: OAuth platform string.
         :param verify_ssl: Set this to false to disable verification of the server's SSL
             certificate. This should only be used while testing!
+        :param metadata_ttl: Number of seconds after which cached metadata is
+            considered outdated. :meth:`fetch_metadata` will then request those types
+            again. By default, metadata is fetched only once.
+        :param token_store: Optional :class:`~zucker.client.tokens.TokenStore` to
+            load OAuth tokens from and save them to. When it contains a token for
+            the same server, user and platform that hasn't expired yet, the initial
+            login with username and password is skipped.
         """
-        values = (base_url, username, password, client_platform)
-        if any(not isinstance(value, str) for value in values):
-            raise TypeError(
-                "all relevant parameters must be provided to create a Sugar client"
-            )
-        if any(len(value) == 0 for value in values):
-            raise ValueError(
-                "all relevant parameters must be provided to create a Sugar client"
-            )
+        for name, value in (
+            ("base_url", base_url),
+            ("username", username),
+            ("password", password),
+            ("client_platform", client_platform),
+        ):
+            if not isinstance(value, str):
+                raise TypeError(
+                    f"all relevant parameters must be provided to create a Sugar "
+                    f"client, got {type(value)!r} for {name}"
+                )
+            if len(value) == 0:
+                raise ValueError(
+                    f"all relevant parameters must be provided to create a Sugar "
+                    f"client, {name} is empty"
+                )
 
         self.base_url = base_url
+        # Every API endpoint lives under the same prefix, so it is only built once.
+        self._rest_url = f"{base_url}/rest/v11_5/"
 
         # The authentication is stored as one of two tuple types, depending on the
         # current state:
@@ -92,33 +150,108 @@ class BaseClient(abc.ABC):
             # This is the initial configuration, holding the username and password.
             Tuple[Literal[False], str, str],
             # After the initial OAuth step has completed, this tuple is stored instead.
-            # It contains the access token, the refresh token and an expiry timestamp,
+            # It contains the access token, the refresh token and the point in time
+            # after which the token should be renewed (on the time.monotonic() clock),
             # in that order.
-            Tuple[Literal[True], str, str, datetime],
+            Tuple[Literal[True], str, str, float],
         ] = (False, username, password)
         self._client_platform = client_platform
         self._verify_ssl = verify_ssl
+        # Headers sent with every request. Implementations pass these dictionaries
+        # along as-is - the OAuth token is updated in place whenever it changes. The
+        # second one is for requests with a body that was already encoded to JSON.
+        self._headers: Dict[str, str] = {"Cache-Control": "no-cache"}
+        self._json_headers: Dict[str, str] = {
+            **self._headers,
+            "Content-Type": "application/json",
+        }
+
+        self._token_store = token_store
+        self._token_origin = TokenOrigin(base_url, username, client_platform)
+        # Refresh token from the token store, for when the stored access token has
+        # already expired. It is tried once before logging in with the password.
+        self._stored_refresh_token: Optional[str] = None
+        if token_store is not None and (
+            stored_tokens := token_store.load(self._token_origin)
+        ):
+            access_token, refresh_token, expires_at = stored_tokens
+            expires_in = expires_at - time.time()
+            if expires_in > 0:
+                self._set_authentication(access_token, refresh_token, expires_in)
+            else:
+                self._stored_refresh_token = refresh_token
 
         self._metadata: MutableJsonMapping = {}
+        # Monotonic timestamps of when each metadata item was fetched, which are used
+        # to expire them (if a TTL is set).
+        self._metadata_ttl = metadata_ttl
+        self._metadata_timestamps: MutableMapping[str, float] = {}
+        # Values derived from metadata items. They are built when first needed and
+        # reset when metadata is updated. The set of module names is used for
+        # containment checks.
+        self._module_names: Optional[Tuple[str, ...]] = None
+        self._module_name_set: Optional[FrozenSet[str]] = None
+        self._server_info: Optional[Tuple[str, str, str]] = None
+
+    def _is_json_mapping(self, value: Any) -> "TypeGuard[JsonMapping]":
+        """Check if a value that was decoded from a server response is a JSON mapping.
+
+        JSON decoders only ever produce valid JSON types, so for plain dictionaries the
+        recursive check from :func:`~zucker.utils.is_json_mapping` is skipped (unless
+        :attr:`_STRICT_JSON_VALIDATION` is set).
+        """
+        if type(value) is dict and not self._STRICT_JSON_VALIDATION:
+            return True
+        return is_json_mapping(value)
 
     def __contains__(self, item: Union[str, Type[BoundModule[Any]]]) -> bool:
         """Check if the server supports a given module name."""
-        from zucker.model.module import BoundModule
-
-        if isinstance(item, type) and issubclass(item, BoundModule):
-            return item._api_name in self.module_names
-        elif isinstance(item, str):
-            return item in self.module_names
+        if isinstance(item, str):
+            name = item
         else:
-            raise TypeError(
-                f"contains checks on a SugarClient are only supported with strings and "
-                f"Module classes, got {type(item)!r}"
-            )
+            # The model package imports this module, so this import can't be at the
+            # top. It only runs for the less common case of checking a module class.
+            from zucker.model.module import BoundModule
+
+            if not (isinstance(item, type) and issubclass(item, BoundModule)):
+                raise TypeError(
+                    f"contains checks on a SugarClient are only supported with strings "
+                    f"and Module classes, got {type(item)!r}"
+                )
+            name = item._api_name
+
+        if self._module_name_set is None:
+            self._module_name_set = frozenset(self.module_names)
+        return name in self._module_name_set
 
     @abc.abstractmethod
     def fetch_metadata(self, *types: str) -> Union[None, Awaitable[None]]:
         """Make sure server metadata for the given set of types is available."""
 
+    def _update_metadata(self, metadata: JsonMapping) -> None:
+        """Store newly fetched metadata items and reset values derived from them."""
+        self._metadata.update(metadata)
+        self._module_names = None
+        self._module_name_set = None
+        self._server_info = None
+        now = time.monotonic()
+        for type_name in metadata:
+            self._metadata_timestamps[type_name] = now
+
+    def _missing_metadata_types(self, types: Sequence[str]) -> Sequence[str]:
+        """Filter out those metadata types that have already been fetched (and
+        haven't expired yet)."""
+        if self._metadata_ttl is None:
+            return [type_name for type_name in types if type_name not in self._metadata]
+
+        oldest_valid_timestamp = time.monotonic() - self._metadata_ttl
+        return [
+            type_name
+            for type_name in types
+            if self._metadata_timestamps.get(type_name, -math.inf)
+            < oldest_valid_timestamp
+        ]
+
     def get_metadata_item(self, type_name: str) -> JsonMapping:
         """Return the cached value of a given metadata item.
 
@@ -134,7 +267,7 @@ class BaseClient(abc.ABC):
                 f"metadata field {type_name!r} is not available"
             )
 
-        if not is_json_mapping(metadata):
+        if not self._is_json_mapping(metadata):
             raise InvalidSugarResponseError("got invalid server metadata")
         return metadata
 
@@ -144,12 +277,15 @@ class BaseClient(abc.ABC):
 
         This requires fetching the ``full_module_list`` metadata item.
         """
-        full_module_list = self.get_metadata_item("full_module_list")
-        assert isinstance(full_module_list, Mapping)
+        if self._module_names is None:
+            full_module_list = self.get_metadata_item("full_module_list")
+            assert isinstance(full_module_list, Mapping)
 
-        yield from (
-            name for name in full_module_list.keys() if not name.startswith("_")
-        )
+            self._module_names = tuple(
+                name for name in full_module_list.keys() if not name.startswith("_")
+            )
+
+        yield from self._module_names
 
     @property
     def server_info(self) -> Tuple[str, str, str]:
@@ -159,6 +295,9 @@ class BaseClient(abc.ABC):
 
         :return: A 3-tuple that follows the syntax (``flavor``, ``version``, ``build``).
         """
+        if self._server_info is not None:
+            return self._server_info
+
         server_info = self.get_metadata_item("server_info")
         assert isinstance(server_info, Mapping)
 
@@ -171,7 +310,8 @@ class BaseClient(abc.ABC):
         build = server_info["build"]
         assert isinstance(build, str)
 
-        return flavor, version, build
+        self._server_info = flavor, version, build
+        return self._server_info
 
     @property
     def authenticated(self) -> bool:
@@ -191,6 +331,8 @@ class BaseClient(abc.ABC):
         - ``("initial authentication", str, dict)`` for the first authentication with
           username and password
         - ``("authentication token renewal", str, dict)`` for renewing an active token
+        - ``("stored authentication token renewal", str, dict)`` for renewing an
+          expired token from the token store
 
         For the second and third outputs, the tuple contains the name of the action
         being performed (for error logging), the API endpoint and the ``data`` parameter
@@ -198,19 +340,17 @@ class BaseClient(abc.ABC):
         """
         if self._authentication[0] is True:
             # Initial OAuth has already happened. The token will be renewed.
-            _, _, refresh_token, expire_timestamp = self._authentication
-            if expire_timestamp > datetime.now() + timedelta(minutes=10):
+            _, _, refresh_token, renewal_timestamp = self._authentication
+            if time.monotonic() < renewal_timestamp:
                 return None
-            return (
-                "authentication token renewal",
-                "oauth2/token/",
-                {
-                    "grant_type": "refresh_token",
-                    "client_id": "sugar",
-                    "client_secret": "",
-                    "refresh_token": refresh_token,
-                    "platform": self._client_platform,
-                },
+            return self._prepare_token_renewal(
+                "authentication token renewal", refresh_token
+            )
+        elif self._stored_refresh_token is not None:
+            # The access token from the token store has expired, but its refresh token
+            # may still be valid.
+            return self._prepare_token_renewal(
+                _STORED_TOKEN_RENEWAL, self._stored_refresh_token
             )
         else:
             # No initial authentication has happened yet. Retrieve the initial tokens.
@@ -228,49 +368,90 @@ class BaseClient(abc.ABC):
                 },
             )
 
+    def _prepare_token_renewal(
+        self, auth_job_name: str, refresh_token: str
+    ) -> Tuple[str, str, Mapping[str, str]]:
+        return (
+            auth_job_name,
+            "oauth2/token/",
+            {
+                "grant_type": "refresh_token",
+                "client_id": "sugar",
+                "client_secret": "",
+                "refresh_token": refresh_token,
+                "platform": self._client_platform,
+            },
+        )
+
     def _finalize_authentication(
         self, auth_job_name: str, response_code: int, response_json: JsonType
     ) -> None:
         """Process the result from the authentication call and save the required
         tokens."""
+        if auth_job_name == _STORED_TOKEN_RENEWAL:
+            # The stored refresh token is only tried once. When it doesn't work
+            # anymore, the next attempt logs in with username and password instead.
+            self._stored_refresh_token = None
+            if not (200 <= response_code < 300):
+                return
         if not (200 <= response_code < 300):
             raise ZuckerException(
                 f"{auth_job_name} failed with status code {response_code}"
             )
 
-        if (
-            not is_json_mapping(response_json)
-            or "access_token" not in response_json
-            or "refresh_token" not in response_json
-            or "expires_in" not in response_json
-        ):
+        if not self._is_json_mapping(response_json):
+            raise InvalidSugarResponseError(
+                "missing response_json fields from authentication result"
+            )
+        # Each field is looked up once. A null value is treated like a missing one.
+        access_token = response_json.get("access_token")
+        refresh_token = response_json.get("refresh_token")
+        expires_in = response_json.get("expires_in")
+        if access_token is None or refresh_token is None or expires_in is None:
             raise InvalidSugarResponseError(
                 "missing response_json fields from authentication result"
             )
 
-        access_token = response_json["access_token"]
-        refresh_token = response_json["refresh_token"]
         if not isinstance(access_token, str) or not isinstance(refresh_token, str):
             raise InvalidSugarResponseError(
                 f"bad authentication data: expected token strings, got "
                 f"{type(access_token)!r} and {type(refresh_token)!r}"
             )
 
-        expires_in = response_json["expires_in"]
         if not isinstance(expires_in, (int, float)):
             raise InvalidSugarResponseError(
                 f"bad authentication data: expected exipry timestamp as a number, got "
                 f"{type(expires_in)!r}"
             )
-        expire_timestamp = datetime.now() + timedelta(seconds=expires_in)
+        self._set_authentication(access_token, refresh_token, expires_in)
+        if self._token_store is not None:
+            self._token_store.save(
+                self._token_origin,
+                access_token,
+                refresh_token,
+                time.time() + expires_in,
+            )
 
-        self._authentication = (True, access_token, refresh_token, expire_timestamp)
+    def _set_authentication(
+        self, access_token: str, refresh_token: str, expires_in: float
+    ) -> None:
+        """Store a set of OAuth tokens that are valid for the given number of
+        seconds."""
+        # Tokens are renewed ten minutes before they actually expire - or after half
+        # their lifetime for short-lived ones, which would otherwise be renewed on
+        # every request. That margin is applied here once so that checking the token
+        # for each request is a single comparison.
+        renewal_timestamp = time.monotonic() + expires_in - min(600, expires_in / 2)
+
+        self._authentication = (True, access_token, refresh_token, renewal_timestamp)
+        self._headers["OAuth-Token"] = access_token
+        self._json_headers["OAuth-Token"] = access_token
 
     def _finalize_request(self, response_code: int, response_json: Any) -> JsonMapping:
         """Process the response from an API request and return a type-checked
         ``JsonMapping`` type.
         """
-        if not is_json_mapping(response_json):
+        if not self._is_json_mapping(response_json):
             raise InvalidSugarResponseError("got invalid JSON response from Sugar")
         if 200 <= response_code < 300:
             return response_json
@@ -313,6 +494,33 @@ class BaseClient(abc.ABC):
 
 
 class SyncClient(BaseClient, abc.ABC):
+    __slots__ = ("_authentication_lock",)
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        *,
+        client_platform: str = "zucker",
+        verify_ssl: bool = True,
+        metadata_ttl: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
+    ):
+        super().__init__(
+            base_url,
+            username,
+            password,
+            client_platform=client_platform,
+            verify_ssl=verify_ssl,
+            metadata_ttl=metadata_ttl,
+            token_store=token_store,
+        )
+
+        # Like in AsyncClient, this makes sure that requests from multiple threads
+        # only authenticate once.
+        self._authentication_lock = threading.Lock()
+
     def close(self) -> None:
         pass
 
@@ -325,7 +533,7 @@ class SyncClient(BaseClient, abc.ABC):
         params: Optional[Mapping[str, str]] = None,
         data: Optional[JsonMapping] = None,
         json: Optional[JsonMapping] = None,
-    ) -> Tuple[int, JsonMapping]:
+    ) -> Tuple[int, JsonType]:
         """Request handling method that should be overridden by client implementations.
 
         This takes the same parameters as :meth:`BaseClient.request`.
@@ -334,6 +542,25 @@ class SyncClient(BaseClient, abc.ABC):
             gotten from the API.
         """
 
+    def _ensure_authentication(self) -> None:
+        if self._prepare_authentication() is None:
+            return
+
+        with self._authentication_lock:
+            # Another thread might have authenticated while this one was waiting for
+            # the lock, so check again. This is a loop because a failed renewal of
+            # stored tokens is followed by a regular login.
+            while (auth_payload := self._prepare_authentication()) is not None:
+                auth_job_name, auth_endpoint, auth_data = auth_payload
+                response_code, response_json = self.raw_request(
+                    "post",
+                    auth_endpoint,
+                    data=auth_data,
+                )
+                self._finalize_authentication(
+                    auth_job_name, response_code, response_json
+                )
+
     def request(
         self,
         method: str,
@@ -343,16 +570,7 @@ class SyncClient(BaseClient, abc.ABC):
         data: Optional[JsonMapping] = None,
         json: Optional[JsonMapping] = None,
     ) -> JsonMapping:
-        auth_payload = self._prepare_authentication()
-
-        if auth_payload is not None:
-            auth_job_name, auth_endpoint, auth_data = auth_payload
-            response_code, response_json = self.raw_request(
-                "post",
-                auth_endpoint,
-                data=auth_data,
-            )
-            self._finalize_authentication(auth_job_name, response_code, response_json)
+        self._ensure_authentication()
 
         response_code, response_json = self.raw_request(
             method, endpoint, params=params, data=data, json=json
@@ -361,16 +579,21 @@ class SyncClient(BaseClient, abc.ABC):
 
     def fetch_metadata(self, *types: str) -> None:
         """Make sure server metadata for the given set of types is available."""
-        self._metadata.update(
+        missing_types = self._missing_metadata_types(types)
+        if not missing_types:
+            return
+        self._update_metadata(
             self.request(
                 "get",
                 "metadata",
-                params={"type_filter": ",".join(types)},
+                params={"type_filter": ",".join(missing_types)},
             )
         )
 
 
 class AsyncClient(BaseClient):
+    __slots__ = ("_handle_bulk", "_authentication_lock")
+
     def __init__(
         self,
         base_url: str,
@@ -379,6 +602,8 @@ class AsyncClient(BaseClient):
         *,
         client_platform: str = "zucker",
         verify_ssl: bool = True,
+        metadata_ttl: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
     ):
         super().__init__(
             base_url,
@@ -386,11 +611,16 @@ class AsyncClient(BaseClient):
             password,
             client_platform=client_platform,
             verify_ssl=verify_ssl,
+            metadata_ttl=metadata_ttl,
+            token_store=token_store,
         )
 
         self._handle_bulk: Optional[
             Callable[[JsonMapping], Awaitable[Tuple[int, JsonMapping]]]
         ] = None
+        # This lock makes sure that concurrent requests only authenticate once. It is
+        # created on first use so that it belongs to the running event loop.
+        self._authentication_lock: Optional[asyncio.Lock] = None
 
     async def close(self) -> None:
         pass
@@ -414,16 +644,25 @@ class AsyncClient(BaseClient):
         """
 
     async def _ensure_authentication(self) -> None:
-        auth_payload = self._prepare_authentication()
-
-        if auth_payload is not None:
-            auth_job_name, auth_endpoint, auth_data = auth_payload
-            response_code, response_json = await self.raw_request(
-                "post",
-                auth_endpoint,
-                data=auth_data,
-            )
-            self._finalize_authentication(auth_job_name, response_code, response_json)
+        if self._prepare_authentication() is None:
+            return
+
+        if self._authentication_lock is None:
+            self._authentication_lock = asyncio.Lock()
+        async with self._authentication_lock:
+            # Another request might have authenticated while this one was waiting for
+            # the lock, so check again. This is a loop because a failed renewal of
+            # stored tokens is followed by a regular login.
+            while (auth_payload := self._prepare_authentication()) is not None:
+                auth_job_name, auth_endpoint, auth_data = auth_payload
+                response_code, response_json = await self.raw_request(
+                    "post",
+                    auth_endpoint,
+                    data=auth_data,
+                )
+                self._finalize_authentication(
+                    auth_job_name, response_code, response_json
+                )
 
     async def request(
         self,
@@ -436,7 +675,7 @@ class AsyncClient(BaseClient):
         allow_bulk: bool = True,
     ) -> JsonMapping:
         response_code: int
-        response_json: JsonMapping
+        response_json: JsonType
 
         if self._handle_bulk is not None and allow_bulk:
             # Important: when making changes, make sure to not await anything in this
@@ -449,13 +688,9 @@ class AsyncClient(BaseClient):
                 )
 
             url = f"/v11_5/{endpoint}"
-            if params is not None:
-                url += "?"
-                url += "&".join(
-                    f"{urllib.parse.quote_plus(key)}={urllib.parse.quote_plus(value)}"
-                    for key, value in params.items()
-                )
-            request_definition = dict(url=url, method=method.upper())
+            if params:
+                url += "?" + urllib.parse.urlencode(params)
+            request_definition = {"url": url, "method": method.upper()}
             if json is not None:
                 request_definition["data"] = dump_json(json)
 
@@ -463,14 +698,10 @@ class AsyncClient(BaseClient):
         else:
             await self._ensure_authentication()
 
-            response_code, raw_response_json = await self.raw_request(
+            # The response is validated in _finalize_request() below.
+            response_code, response_json = await self.raw_request(
                 method, endpoint, params=params, data=data, json=json
             )
-            if not is_json_mapping(raw_response_json):
-                raise InvalidSugarResponseError(
-                    f"expected JSON response, got {type(raw_response_json)}"
-                )
-            response_json = raw_response_json
 
         return self._finalize_request(response_code, response_json)
 
@@ -553,8 +784,17 @@ class AsyncClient(BaseClient):
         Do not use this is threaded environments -- the implementation is not
         thread-safe.
 
+        When this is called from inside an action of another :meth:`bulk` call, the
+        actions are simply gathered. Their requests then become part of the outer
+        call's batches.
+
         .. _Bulk API: https://support.sugarcrm.com/Documentation/Sugar_Developer/Sugar_Developer_Guide_11.3/Integration/Web_Services/REST_API/Endpoints/bulk_POST/
         """
+        if self._handle_bulk is not None:
+            # Starting a second batching loop here would replace (and later reset) the
+            # handler of the outer one.
+            return tuple(await asyncio.gather(*actions))
+
         # These dictionaries store the prepared requests that should be sent. Each
         # definition contains a JSON object in the form accepted by the bulk Sugar API
         # (see the link in this method's docstring). Every request that gets started
@@ -599,18 +839,25 @@ class AsyncClient(BaseClient):
         async def run_action(action: Awaitable[_T]) -> _T:
             return await action
 
+        # Finished actions are counted as they complete so that the loop below doesn't
+        # need to check every task again each time it wakes up.
+        done_task_count = 0
+
+        def handle_task_done(_: Any) -> None:
+            nonlocal done_task_count
+            done_task_count += 1
+            counting_event.set()
+
         self._handle_bulk = handle_bulk
         action_tasks = [asyncio.create_task(run_action(action)) for action in actions]
         for task in action_tasks:
-            task.add_done_callback(lambda *_: counting_event.set())
+            task.add_done_callback(handle_task_done)
 
         # This loop will run as long as at least on action hasn't returned yet and
         # therefore may still be waiting on a request. Further, that action may even
         # perform more requests after that. We handle that case by sending requests
         # off in batches - one in each round of this loop.
-        while (
-            done_task_count := sum(1 for task in action_tasks if task.done())
-        ) != len(actions):
+        while done_task_count != len(actions):
             # Wait until all tasks have either completed (for those that don't actually
             # use the server) or are waiting for the actual server request to start (and
             # have therefore registered themselves in the request_definitions list). In
@@ -657,7 +904,7 @@ class AsyncClient(BaseClient):
                     )
                 if (
                     "contents" not in item
-                    or not is_json_mapping(item["contents"])
+                    or not self._is_json_mapping(item["contents"])
                     or "status" not in item
                     or not isinstance(item["status"], int)
                 ):
@@ -672,14 +919,19 @@ class AsyncClient(BaseClient):
                 event.set()
 
         self._handle_bulk = None
-        return await asyncio.gather(*action_tasks)  # type: ignore
+        # The loop above only exits once every task is done, so the results are
+        # available without waiting on the event loop again.
+        return tuple(task.result() for task in action_tasks)
 
     async def fetch_metadata(self, *types: str) -> None:
         """Make sure server metadata for the given set of types is available."""
-        self._metadata.update(
+        missing_types = self._missing_metadata_types(types)
+        if not missing_types:
+            return
+        self._update_metadata(
             await self.request(
                 "get",
                 "metadata",
-                params={"type_filter": ",".join(types)},
+                params={"type_filter": ",".join(missing_types)},
             )
         )
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Mapping, Optional, Tuple
+from typing import Mapping, Optional, Tuple, Union
 
-from zucker.utils import JsonMapping
+from zucker.utils import JsonMapping, JsonType, dump_json_bytes, load_json
 
 from .base import SyncClient
+from .tokens import TokenStore
 
 
 class RequestsClient(SyncClient):
@@ -21,6 +22,8 @@ class RequestsClient(SyncClient):
         *,
         client_platform: str = "zucker",
         verify_ssl: bool = True,
+        metadata_ttl: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
     ):
         import requests
 
@@ -30,9 +33,15 @@ class RequestsClient(SyncClient):
             password,
             client_platform=client_platform,
             verify_ssl=verify_ssl,
+            metadata_ttl=metadata_ttl,
+            token_store=token_store,
         )
+        # The session keeps connections to the server alive between requests.
         self._session = requests.Session()
 
+    def close(self) -> None:
+        self._session.close()
+
     def raw_request(
         self,
         method: str,
@@ -41,17 +50,24 @@ class RequestsClient(SyncClient):
         params: Optional[Mapping[str, str]] = None,
         data: Optional[JsonMapping] = None,
         json: Optional[JsonMapping] = None,
-    ) -> Tuple[int, JsonMapping]:
+    ) -> Tuple[int, JsonType]:
+        headers = self._headers
+        body: Union[None, bytes, JsonMapping] = data
+        if json is not None:
+            # JSON bodies are encoded here with the same (possibly faster) encoder
+            # that is used for decoding responses.
+            headers = self._json_headers
+            body = dump_json_bytes(json)
+
         response = self._session.request(
             method,
-            f"{self.base_url}/rest/v11_5/{endpoint}",
-            headers={
-                "OAuth-Token": self._authentication[1],
-                "Cache-Control": "no-cache",
-            },
+            self._rest_url + endpoint,
+            headers=headers,
+            params=params,
+            data=body,
+            # This is passed on every request instead of being set on the session,
+            # because requests lets REQUESTS_CA_BUNDLE and CURL_CA_BUNDLE override
+            # the session's setting.
             verify=self._verify_ssl,
-            params=params or {},
-            data=data or {},
-            json=json or {},
         )
-        return response.status_code, response.json()
+        return response.status_code, load_json(response.content)
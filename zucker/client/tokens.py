@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import List, Optional, Protocol, Tuple, Union
+
+from zucker.utils import JsonMapping, dump_json, is_json_mapping, load_json
+
+__all__ = ["TokenOrigin", "TokenStore", "FileTokenStore"]
+
+
+@dataclass(frozen=True)
+class TokenOrigin:
+    """Server, user and OAuth platform that a set of tokens was issued for."""
+
+    base_url: str
+    username: str
+    client_platform: str
+
+
+def _is_entry_for(entry: JsonMapping, origin: TokenOrigin) -> bool:
+    return (
+        entry.get("base_url") == origin.base_url
+        and entry.get("username") == origin.username
+        and entry.get("client_platform") == origin.client_platform
+    )
+
+
+class TokenStore(Protocol):
+    """Storage for OAuth tokens that outlives a single client instance.
+
+    When a client is given a token store, it will try to load tokens from it when it
+    is created and save new ones after every authentication. That way, a new process
+    can reuse a session instead of logging in with username and password again.
+
+    Tokens are always loaded and saved together with the :class:`TokenOrigin` of the
+    client. A store must never return tokens that were saved for another origin.
+    """
+
+    def load(self, origin: TokenOrigin) -> Optional[Tuple[str, str, float]]:
+        """Return the last access token, refresh token and expiry time (as a Unix
+        timestamp) saved for the given origin or ``None`` if there are none."""
+
+    def save(
+        self,
+        origin: TokenOrigin,
+        access_token: str,
+        refresh_token: str,
+        expires_at: float,
+    ) -> None:
+        """Save a set of tokens, replacing any previous ones for the same origin."""
+
+
+class FileTokenStore:
+    """Token store that keeps tokens in a JSON file.
+
+    The file holds one set of tokens per origin, so it may be shared between clients
+    for different servers or users.
+
+    Tokens are first written to a temporary file in the same directory, which is
+    then moved over the previous one. That way, the file is replaced atomically (a
+    crash never leaves a half-written file behind) and always ends up readable only
+    by the current user, even if it previously existed with broader permissions.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]]):
+        self.path = path
+
+    def _load_entries(self) -> List[JsonMapping]:
+        try:
+            with open(self.path, "rb") as token_file:
+                data = load_json(token_file.read())
+        except (OSError, ValueError):
+            return []
+
+        if not is_json_mapping(data):
+            return []
+        entries = data.get("tokens")
+        if not isinstance(entries, list):
+            return []
+        return [entry for entry in entries if is_json_mapping(entry)]
+
+    def load(self, origin: TokenOrigin) -> Optional[Tuple[str, str, float]]:
+        for entry in self._load_entries():
+            if not _is_entry_for(entry, origin):
+                continue
+            access_token = entry.get("access_token")
+            refresh_token = entry.get("refresh_token")
+            expires_at = entry.get("expires_at")
+            if (
+                not isinstance(access_token, str)
+                or not isinstance(refresh_token, str)
+                or not isinstance(expires_at, (int, float))
+            ):
+                return None
+            return access_token, refresh_token, expires_at
+        return None
+
+    def save(
+        self,
+        origin: TokenOrigin,
+        access_token: str,
+        refresh_token: str,
+        expires_at: float,
+    ) -> None:
+        entries = [
+            entry for entry in self._load_entries() if not _is_entry_for(entry, origin)
+        ]
+        entries.append(
+            {
+                "base_url": origin.base_url,
+                "username": origin.username,
+                "client_platform": origin.client_platform,
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "expires_at": expires_at,
+            }
+        )
+        content = dump_json({"tokens": entries})
+
+        # mkstemp() creates the file with mode 0o600.
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp"
+        )
+        try:
+            try:
+                token_file = open(file_descriptor, "w", encoding="utf-8")
+            except BaseException:
+                os.close(file_descriptor)
+                raise
+            with token_file:
+                token_file.write(content)
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
@@ -16,7 +16,6 @@ from typing import (
     Type,
     TypeVar,
     Union,
-    cast,
 )
 
 from zucker.client import SyncClient
@@ -87,16 +86,124 @@ def inspect_enum(context: FieldInspectionContext) -> Mapping[str, Any]:
     }
 
 
+# Marker for attributes that aren't present in field metadata.
+_MISSING = object()
+
+_MetadataCheck = Tuple[Tuple[str, ...], Callable[[JsonType], bool]]
+
+
+def _compile_metadata_check(
+    key: str, expected_value: JsonPrimitiveOrCheckFn
+) -> _MetadataCheck:
+    """Prepare a metadata attribute check for :meth:`FieldMetadataRegistry.register`.
+
+    The returned tuple contains the path to the attribute (which may be nested, for
+    example ``full_text_search.enabled``) and a function that checks its value. The
+    expected value may either be given directly, as a type or as a callable.
+    """
+    check: Callable[[JsonType], bool]
+    if isinstance(expected_value, type):
+        expected_type = expected_value
+
+        def check(value: JsonType) -> bool:
+            return isinstance(value, expected_type)
+
+    elif callable(expected_value):
+        check_fn = expected_value
+
+        def check(value: JsonType) -> bool:
+            try:
+                return bool(check_fn(value))  # type: ignore
+            except:
+                return False
+
+    else:
+
+        def check(value: JsonType) -> bool:
+            return value == expected_value
+
+    return tuple(key.split(".")), check
+
+
+def _check_metadata_attribute(
+    field_metadata: JsonMapping,
+    path: Tuple[str, ...],
+    check: Callable[[JsonType], bool],
+) -> Optional[bool]:
+    """Run a metadata check on a field.
+
+    :return: ``None`` if the attribute isn't present, otherwise the result of the
+        check.
+    """
+    # Go through the entire metadata tree and find the exact subtree we are looking
+    # for. This will make sure that when we are given a key of
+    # 'full_text_search.enabled' we are actually looking at the full_text_search
+    # subtree.
+    current_item: Any = field_metadata
+    for path_name in path:
+        # Decoded metadata consists of plain dictionaries, which can be checked without
+        # going through the Mapping ABC. Other mappings are still supported, though.
+        if type(current_item) is dict or isinstance(current_item, Mapping):
+            current_item = current_item.get(path_name, _MISSING)
+        else:
+            return None
+        if current_item is _MISSING:
+            return None
+    return check(current_item)
+
+
+_SOURCE_IS_DB_CHECK = _compile_metadata_check(
+    "source", lambda source: source != "non-db"
+)
+
+
 class FieldMetadataRegistry:
     def __init__(self) -> None:
         self.field_initializers: List[
             Callable[[FieldInspectionContext], FieldInitializerReturnType]
         ] = []
         self.field_types: Set[Type[Field[Any, Any]]] = set()
+        # Sugar field types (the 'type' metadata attribute) that initializers created
+        # by register() require. Initializers that aren't in here (because they don't
+        # require a type or were added to field_initializers directly) are tried for
+        # every field.
+        self._required_sugar_types: Dict[
+            Callable[[FieldInspectionContext], FieldInitializerReturnType], str
+        ] = {}
+        # Candidate initializers for each Sugar type, in order. None is used as the
+        # key for fields without a (string) type. The cache is only valid for the
+        # list of initializers it was built from, which is kept as a copy because
+        # field_initializers may be changed from the outside.
+        self._initializers_by_sugar_type: Dict[
+            Optional[str],
+            Sequence[Callable[[FieldInspectionContext], FieldInitializerReturnType]],
+        ] = {}
+        self._cached_field_initializers: List[
+            Callable[[FieldInspectionContext], FieldInitializerReturnType]
+        ] = []
 
     def __call__(self, context: FieldInspectionContext) -> FieldInitializerReturnType:
         """Find the first registered field that accepts a specified context."""
-        for initialize in self.field_initializers:
+        if self._cached_field_initializers != self.field_initializers:
+            self._initializers_by_sugar_type.clear()
+            self._cached_field_initializers = list(self.field_initializers)
+
+        sugar_type = context.field_metadata.get("type")
+        if not isinstance(sugar_type, str):
+            sugar_type = None
+
+        try:
+            initializers = self._initializers_by_sugar_type[sugar_type]
+        except KeyError:
+            # Initializers that require another type can't match, so only the
+            # remaining ones are tried (still in the order they were registered in).
+            initializers = self._initializers_by_sugar_type[sugar_type] = [
+                initialize
+                for initialize in self._cached_field_initializers
+                if self._required_sugar_types.get(initialize, sugar_type) == sugar_type
+            ]
+
+        for initialize in initializers:
             result = initialize(context)
             if result is not None:
                 return result
@@ -141,57 +248,34 @@ class FieldMetadataRegistry:
         .. _Sugar Documentation: https://support.sugarcrm.com/Documentation/Sugar_Developer/Sugar_Developer_Guide_10.0/Data_Framework/Vardefs/#Fields_Array
         """
 
+        # Attribute keys and expected values are turned into checks once here, so
+        # matching a field only needs to run them.
+        required_checks = [
+            _compile_metadata_check(key, expected_value)
+            for key, expected_value in (metadata_attributes or {}).items()
+        ]
+        optional_checks = [
+            _compile_metadata_check(key, expected_value)
+            for key, expected_value in (optional_metadata_attributes or {}).items()
+        ]
+        if require_db:
+            optional_checks.append(_SOURCE_IS_DB_CHECK)
+        required_sugar_type = (metadata_attributes or {}).get("type")
+        if not isinstance(required_sugar_type, str):
+            required_sugar_type = None
+
         def decorate(field_type: Type[_F]) -> Type[_F]:
             def initialize(
                 context: FieldInspectionContext,
             ) -> FieldInitializerReturnType:
-                def check_metadata_attribute(
-                    key: str, expected_value: JsonPrimitiveOrCheckFn
-                ) -> Optional[bool]:
-                    # Go through the entire metadata tree and find the exact subtree we
-                    # are looking for. This will make sure that when we are given a key
-                    # of 'full_text_search.enabled' we are actually looking at the
-                    # full_text_search subtree.
-                    path_names = key.split(".")
-                    current_item: Union[JsonMapping, JsonType] = context.field_metadata
-                    for path_name in path_names:
-                        if not isinstance(current_item, Mapping):
-                            return None
-                        if path_name not in current_item:
-                            return None
-                        current_item = current_item[path_name]
-                    value = cast(JsonType, current_item)
-
-                    # current_item should now be the expected value. The latter may
-                    # either be given directly, as a type or as a callable.
-                    if isinstance(expected_value, type):
-                        if not isinstance(current_item, expected_value):
-                            return False
-                    elif callable(expected_value):
-                        try:
-                            if not expected_value(current_item):  # type: ignore
-                                return False
-                        except:
-                            return False
-                    else:
-                        if current_item != expected_value:
-                            return False
-                    return True
-
-                for item in (metadata_attributes or {}).items():
-                    if check_metadata_attribute(*item) is not True:
+                field_metadata = context.field_metadata
+                for path, check in required_checks:
+                    if not _check_metadata_attribute(field_metadata, path, check):
                         return None
-                for item in (optional_metadata_attributes or {}).items():
+                for path, check in optional_checks:
                     # Optional attributes must either match or not be present.
-                    if check_metadata_attribute(*item) is False:
+                    if _check_metadata_attribute(field_metadata, path, check) is False:
                         return None
-                if require_db and (
-                    check_metadata_attribute(
-                        "source", lambda source: source != "non-db"
-                    )
-                    is False
-                ):
-                    return None
 
                 # If we got until here, the field matches.
                 suggested_arguments: Mapping[str, Any]
@@ -212,6 +296,8 @@ class FieldMetadataRegistry:
                 return field_type, {**extra_arguments, **suggested_arguments}
 
             self.field_initializers.append(initialize)
+            if required_sugar_type is not None:
+                self._required_sugar_types[initialize] = required_sugar_type
             self.field_types.add(field_type)
             return field_type
 
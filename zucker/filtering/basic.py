@@ -22,6 +22,8 @@ class BasicFilter(Generic[Filters], ABC):
     ``&`` and ``|`` operators to create more complex filter sets.
     """
 
+    __slots__ = ("field_name", "filters")
+
     def __init__(self, field_name: str, filters: Filters):
         self.field_name = field_name
         self.filters = filters
@@ -51,6 +53,8 @@ class BasicFilter(Generic[Filters], ABC):
 
 
 class NegatableFilter(Generic[Filters], BasicFilter[Filters], ABC):
+    __slots__ = ()
+
     def __invert__(self) -> NegatableFilter[Filters]:
         raise NotImplementedError(
             "subclasses of NegatableFilter must implement the __invert__ protocol"
@@ -67,17 +71,21 @@ class ValuesFilter(
     produced. If more then one value is provided, it will switch to the ``$in``
     operator, which allows checking for multiple accepted values.
 
-    This filter can be negated using the ``~`` operator.
+    This filter can be negated using the ``~`` operator. Alternatively, pass
+    ``negated=True`` to directly create the negated version.
     """
 
-    def __init__(self, field_name: str, *filters: ApiType):
-        if any(not isinstance(item, str) for item in filters):
-            # TODO This doesn't currently match the type defintion above.
-            raise TypeError("values for a value filter must strings")
+    __slots__ = ("negated", "_single")
+
+    def __init__(self, field_name: str, *filters: ApiType, negated: bool = False):
         if len(filters) == 0:
             raise ValueError("did not provide any values for a value filter")
+        for item in filters:
+            if not isinstance(item, str):
+                # TODO This doesn't currently match the type defintion above.
+                raise TypeError("values for a value filter must strings")
 
-        self.negated = False
+        self.negated = negated
         self._single = False
 
         if len(filters) == 1:
@@ -87,15 +95,12 @@ class ValuesFilter(
             super().__init__(field_name, filters)
 
     def __invert__(self) -> ValuesFilter[ApiType]:
-        result: ValuesFilter[ApiType]
+        values: Sequence[ApiType]
         if self._single:
-            result = ValuesFilter(self.field_name, cast("ApiType", self.filters))
+            values = (cast("ApiType", self.filters),)
         else:
-            result = ValuesFilter(
-                self.field_name, *(cast("Sequence[ApiType]", self.filters))
-            )
-        result.negated = not self.negated
-        return result
+            values = cast("Sequence[ApiType]", self.filters)
+        return ValuesFilter(self.field_name, *values, negated=not self.negated)
 
     @property
     def operator(self) -> str:
@@ -108,18 +113,19 @@ class ValuesFilter(
 class NullishFilter(NegatableFilter[None]):
     """Basic filter that checks if the field is None (or ``null`` in Sugar).
 
-    This filter can be negated using the ``~`` operator.
+    This filter can be negated using the ``~`` operator. Alternatively, pass
+    ``negated=True`` to directly create the negated version.
     """
 
-    def __init__(self, field_name: str):
+    __slots__ = ("negated",)
+
+    def __init__(self, field_name: str, *, negated: bool = False):
         super().__init__(field_name, None)
 
-        self.negated = False
+        self.negated = negated
 
     def __invert__(self) -> NullishFilter:
-        result = NullishFilter(self.field_name)
-        result.negated = not self.negated
-        return result
+        return NullishFilter(self.field_name, negated=not self.negated)
 
     @property
     def operator(self) -> str:
@@ -127,6 +133,8 @@ class NullishFilter(NegatableFilter[None]):
 
 
 class StringFilter(BasicFilter[str], ABC):
+    __slots__ = ()
+
     def __init__(self, field_name: str, value: str):
         if not isinstance(value, str):
             raise TypeError(
@@ -141,37 +149,39 @@ class StringFilter(BasicFilter[str], ABC):
 class StringStartsFilter(StringFilter):
     """Basic filter that checks if the string field starts with a given pattern."""
 
-    @property
-    def operator(self) -> str:
-        return "$starts"
+    __slots__ = ()
+
+    operator = "$starts"
 
 
 class StringEndsFilter(StringFilter):
     """Basic filter that checks if the string field ends with a given pattern."""
 
-    @property
-    def operator(self) -> str:
-        return "$ends"
+    __slots__ = ()
+
+    operator = "$ends"
 
 
 class StringContainsFilter(StringFilter):
     """Basic filter that checks if the string field contains a given pattern."""
 
-    @property
-    def operator(self) -> str:
-        return "$ends"
+    __slots__ = ()
+
+    operator = "$contains"
 
 
 class NotEmptyFilter(BasicFilter[Literal[""]]):
+    __slots__ = ()
+
+    operator = "$not_empty"
+
     def __init__(self, field_name: str):
         super().__init__(field_name, "")
 
-    @property
-    def operator(self) -> str:
-        return "$not_empty"
-
 
 class NumericFilter(NegatableFilter[Real]):
+    __slots__ = ("_greater", "_equal")
+
     def __init__(
         self,
         field_name: str,
@@ -1,79 +1,113 @@
 from __future__ import annotations
 
-import copy
-from typing import Mapping, Union
+from typing import List, Mapping, Tuple, Union, cast
 
-from ..utils import JsonMapping
+from ..utils import JsonMapping, JsonType
 from .types import Combinator, GenericFilter
 
 FilterOrMapping = Union[GenericFilter, JsonMapping]
 
+# Enum.value goes through a descriptor on each access, so the API keys are looked up
+# from a plain dictionary instead.
+_COMBINATOR_KEYS: Mapping[Combinator, str] = {
+    combinator: combinator.value for combinator in Combinator
+}
+
+
+def _copy_json(value: JsonType) -> JsonType:
+    """Deep-copy a JSON-like value.
+
+    Only containers (mappings, lists and tuples) are copied - everything else is
+    returned as-is. Compared to :func:`copy.deepcopy`, this skips the memo and
+    dispatch overhead, while still keeping the types of the leaf values intact.
+    """
+    if isinstance(value, Mapping):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_json(item) for item in value)
+    return value
+
 
 class FilterSet:
+    __slots__ = ("combinator", "_parts")
+
+    _parts: Tuple[JsonMapping, ...]
+
     def __init__(
         self,
         combinator: Combinator,
         *given_parts: Union[FilterOrMapping, None],
     ):
         self.combinator = combinator
-        self._parts = list(given_parts)
+        parts: List[Union[FilterOrMapping, None]] = list(given_parts)
 
         index = 0
-        while index < len(self._parts):
-            part = self._parts[index]
+        while index < len(parts):
+            part = parts[index]
 
             if part is None:
-                del self._parts[index]
+                del parts[index]
                 continue
 
-            if not isinstance(part, (GenericFilter, Mapping)):
-                raise TypeError(
-                    f"FilterSet parts must be either dictionaries or generic filter "
-                    f"compatible objects (like other FilterSets), got {type(part)!r}"
-                )
-
-            # Merge together this filterset and the provided one in these three cases:
-            # 1) The current and the new filterset have the same combinator. This will
-            #    convert constructs like this:
-            #      (A or B or (C or (D or E)))
-            #    into something flatter like this:
-            #      (A or B or C or D or E)
-            # 2) The new filterset has at most one part. In that case, that part (if
-            #    available) can be merged into this filterset without changing the
-            #    output boolean expression:
-            #      (A or (B) or C)
-            #    becomes
-            #      (A or B or C)
-            # 3) The new filterset is the only part we currently have. This is the
-            #    reverse condition of the last case. The only difference here is that we
-            #    don't keep our own combinator but rather that of the new filterset.
-            #    Something like this:
-            #      (None or (A and B))
-            #    will be extracted to:
-            #      (A and B)
-            if isinstance(part, FilterSet):
-                # This variable checks for the third condition above.
-                merge_other = all(
-                    other_part is None or other_part is part
-                    for other_part in self._parts
-                )
-                if part.combinator == combinator or len(part._parts) < 2 or merge_other:
-                    del self._parts[index]
-                    self._parts[index:index] = part._parts
-                    if merge_other:
-                        self.combinator = part.combinator
-                    continue
-
-            # Render everything to an actual filter dictionary so that the whole
-            # filterset remains immutable.
-            if isinstance(part, GenericFilter):
+            # Plain mappings are by far the most common parts, so they are checked for
+            # first. That way, the (comparatively slow) protocol check below only runs
+            # for objects that actually need to be rendered.
+            if not isinstance(part, Mapping):
+                # Merge together this filterset and the provided one in these three
+                # cases:
+                # 1) The current and the new filterset have the same combinator. This
+                #    will convert constructs like this:
+                #      (A or B or (C or (D or E)))
+                #    into something flatter like this:
+                #      (A or B or C or D or E)
+                # 2) The new filterset has at most one part. In that case, that part
+                #    (if available) can be merged into this filterset without changing
+                #    the output boolean expression:
+                #      (A or (B) or C)
+                #    becomes
+                #      (A or B or C)
+                # 3) The new filterset is the only part we currently have. This is the
+                #    reverse condition of the last case. The only difference here is
+                #    that we don't keep our own combinator but rather that of the new
+                #    filterset. Something like this:
+                #      (None or (A and B))
+                #    will be extracted to:
+                #      (A and B)
+                if isinstance(part, FilterSet):
+                    # This variable checks for the third condition above.
+                    merge_other = all(
+                        other_part is None or other_part is part for other_part in parts
+                    )
+                    if (
+                        part.combinator is combinator
+                        or len(part._parts) < 2
+                        or merge_other
+                    ):
+                        del parts[index]
+                        parts[index:index] = part._parts
+                        if merge_other:
+                            self.combinator = part.combinator
+                        continue
+                elif not isinstance(part, GenericFilter):
+                    raise TypeError(
+                        f"FilterSet parts must be either dictionaries or generic "
+                        f"filter compatible objects (like other FilterSets), got "
+                        f"{type(part)!r}"
+                    )
+
+                # Render everything to an actual filter dictionary so that the whole
+                # filterset remains immutable.
                 part = part.build_filter()
 
-            assert isinstance(part, Mapping)
-
-            self._parts[index] = copy.deepcopy(part)
+            parts[index] = cast(JsonMapping, _copy_json(part))
             index += 1
 
+        # At this point, every part has been flattened and rendered into a mapping, so
+        # building the filter is only a matter of copying them.
+        self._parts = tuple(cast("List[JsonMapping]", parts))
+
     def __or__(self, other: FilterOrMapping) -> FilterSet:
         return self._combine(self, other, Combinator.OR)
 
@@ -99,11 +133,10 @@ class FilterSet:
         return NotImplemented  # type: ignore
 
     def build_filter(self) -> JsonMapping:
+        # The parts are private copies that never change. Callers get their own copy
+        # of them, so that modifying the output doesn't affect this set.
         return {
-            self.combinator.value: [
-                copy.deepcopy(
-                    part.build_filter() if isinstance(part, GenericFilter) else part
-                )
-                for part in self._parts
+            _COMBINATOR_KEYS[self.combinator]: [
+                _copy_json(part) for part in self._parts
             ]
         }
@@ -35,6 +35,15 @@ SetType = TypeVar("SetType")
 Self = TypeVar("Self", bound="Field[Any, Any]")
 AnyModule = Union["SyncModule", "AsyncModule", "UnboundModule"]
 
+_FIELD_NAME_PATTERN = re.compile(r"[^ ]+")
+
+
+def _check_field_name(name: Any) -> None:
+    if not isinstance(name, str):
+        raise TypeError(f"field name must be a string, got {name!r}")
+    if _FIELD_NAME_PATTERN.fullmatch(name) is None:
+        raise ValueError("field name may not be empty and must not contain spaces")
+
 
 class Field(Generic[ModuleType, GetType], abc.ABC):
     """Base class for all fields.
@@ -46,17 +55,21 @@ class Field(Generic[ModuleType, GetType], abc.ABC):
     module.
     """
 
+    __slots__ = ("_api_name", "_name")
+
     def __init__(self, api_name: Optional[str] = None):
+        if api_name is not None:
+            _check_field_name(api_name)
         self._api_name = api_name
-        self._name: Optional[str] = "test"
-        # Check the name to make sure it's valid.
-        self.name  # noqa
-        self._name = None
+        self._name: Optional[str] = None
 
     def __set_name__(self, owner: ModuleType, name: str) -> None:
+        # An explicit API name takes precedence (and has already been checked in the
+        # constructor), so the attribute name only needs to be valid when it is
+        # actually used.
+        if self._api_name is None:
+            _check_field_name(name)
         self._name = name
-        # Check the name to make sure it's valid.
-        self.name  # noqa
 
     @overload
     def __get__(self: Self, instance: ModuleType, owner: Type[BaseModule]) -> GetType:
@@ -101,21 +114,14 @@ class Field(Generic[ModuleType, GetType], abc.ABC):
     @property
     def name(self) -> str:
         if self._api_name is not None:
-            result = self._api_name
+            return self._api_name
         elif self._name is None:
             raise RuntimeError(
                 "Could not retrieve the field's model name. Check for the correct "
                 "Field() usage - otherwise this is a bug."
             )
         else:
-            result = self._name
-
-        if not isinstance(result, str):
-            raise TypeError(f"field name must be a string, got {result!r}")
-        if result == "" or " " in result:
-            raise ValueError("field name may not be empty and must not contain spaces")
-
-        return result
+            return self._name
 
     @abc.abstractmethod
     def _get_value(self, record: ModuleType) -> GetType:
@@ -135,6 +141,8 @@ class MutableField(
     return native date objects but additionally accept strings for setting.
     """
 
+    __slots__ = ()
+
     def __set__(self, instance: ModuleType, value: SetType) -> None:
         from ..module import BaseModule
 
@@ -170,6 +178,8 @@ class ScalarField(
         2. Validators are always evaluated on the api data type. That means that they are run *after* serializing any user input.
     """
 
+    __slots__ = ("_validators",)
+
     def __init__(
         self,
         api_name: Optional[str] = None,
@@ -268,7 +278,12 @@ class ScalarField(
             >>> Person.name != "Ben" # Is the same as ~(Person.name.values("Ben"))
             >>> Person.supervisor != None # Is the same as ~(Person.supervisor.null())
         """
-        return ~(self.__eq__(other))
+        # The negated filters are created directly here, instead of building the
+        # regular ones first and then inverting them.
+        if other is None:
+            return NullishFilter(self.name, negated=True)
+        else:
+            return ValuesFilter(self.name, self.serialize(other), negated=True)
 
     def values(self, *values: Union[NativeType, ApiType]) -> ValuesFilter[ApiType]:
         """Filter for exact values of this field.
@@ -298,9 +313,7 @@ class ScalarField(
             >>> Person.name == "Ben"
             >>> Person.name != "Ben"
         """
-        return ValuesFilter(
-            self.name, *tuple(self.serialize(raw_value) for raw_value in values)
-        )
+        return ValuesFilter(self.name, *map(self.serialize, values))
 
     def null(self) -> NullishFilter:
         """Filter for whether the field is null.
@@ -336,6 +349,8 @@ class MutableScalarField(
 ):
     """Mutable version of :class:`ScalarField`."""
 
+    __slots__ = ()
+
     def _set_value(self, record: BaseModule, value: Union[ApiType, NativeType]) -> None:
         raw_value = self.serialize(value)
         for validate in self._validators:
@@ -346,6 +361,8 @@ class MutableScalarField(
 class NumericField(Generic[ApiType], ScalarField[ApiType, ApiType], abc.ABC):
     """Scalar field with filtering operators that produce a total ordering."""
 
+    __slots__ = ()
+
     def __lt__(self, other: Any) -> NumericFilter:
         """Filter for values less than the specified scalar:
 
@@ -390,3 +407,5 @@ class MutableNumericField(
     abc.ABC,
 ):
     """Mutable version of :class:`NumericField`."""
+
+    __slots__ = ()
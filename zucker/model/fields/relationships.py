@@ -16,6 +16,8 @@ __all__ = ["RelatedField"]
 class BaseRelatedField(
     Generic[ModuleType, GetType], Field[ModuleType, GetType], abc.ABC
 ):
+    __slots__ = ("_link_name",)
+
     def __init__(
         self,
         link_name: str,
@@ -33,6 +35,8 @@ class BaseRelatedField(
 class SyncRelatedField(
     Generic[SyncModuleType], BaseRelatedField["SyncModule", SyncView[SyncModuleType]]
 ):
+    __slots__ = ("_related_module",)
+
     def __init__(
         self,
         related_module: Type[SyncModuleType],
@@ -79,6 +83,8 @@ class AsyncRelatedField(
     Generic[AsyncModuleType],
     BaseRelatedField["AsyncModule", AsyncView[AsyncModuleType]],
 ):
+    __slots__ = ("_related_module",)
+
     def __init__(
         self,
         related_module: Type[AsyncModuleType],
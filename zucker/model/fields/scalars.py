@@ -37,6 +37,8 @@ class IdField(ScalarField[UUID, str]):
     Python, IDs are represented by :class:`UUID` objects.
     """
 
+    __slots__ = ()
+
     @classmethod
     def load_value(cls, raw_value: JsonType) -> UUID:
         if not isinstance(raw_value, str):
@@ -46,8 +48,9 @@ class IdField(ScalarField[UUID, str]):
     @classmethod
     def serialize(cls, value: Union[UUID, str]) -> str:
         if isinstance(value, str):
-            # "Load" the value to check if it is a valid ID.
-            value = cls.load_value(value)
+            # Parse the value to check if it is a valid ID. This also normalizes the
+            # notation.
+            value = UUID(value)
         return str(value)
 
 
@@ -61,6 +64,8 @@ class URLField(MutableScalarField[urllib_parse.ParseResult, str]):
     object.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def load_value(raw_value: JsonType) -> urllib_parse.ParseResult:
         if not isinstance(raw_value, str):
@@ -95,6 +100,8 @@ class LegacyEmailField(MutableScalarField[str, str]):
       Sugar backend will have the final call on what is treated as valid.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def load_value(raw_value: JsonType) -> str:
         if not isinstance(raw_value, str):
@@ -127,6 +134,8 @@ class StringField(MutableScalarField[str, str]):
     ``text``, ``encrypt``, ``longtext`` or ``textarea``.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def load_value(raw_value: JsonType) -> str:
         if not isinstance(raw_value, str):
@@ -161,6 +170,8 @@ class StringField(MutableScalarField[str, str]):
 class BooleanField(MutableScalarField[bool, bool]):
     """Mutable field for boolean columns."""
 
+    __slots__ = ()
+
     @staticmethod
     def load_value(raw_value: JsonType) -> bool:
         if not isinstance(raw_value, bool):
@@ -191,6 +202,8 @@ class FloatField(MutableNumericField[float]):
     This is appropriate for backend fields that have the type ``float`` or ``decimal``.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def load_value(raw_value: JsonType) -> float:
         if not isinstance(raw_value, float):
@@ -218,6 +231,8 @@ class IntegerField(MutableNumericField[int]):
     ``tinyint`` or ``ulong``.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def load_value(raw_value: JsonType) -> int:
         if not isinstance(raw_value, int):
@@ -248,6 +263,8 @@ class EnumField(Generic[EnumType], MutableScalarField[EnumType, Union[str, int,
         elements should be strings (unless otherwise specified on the server side).
     """
 
+    __slots__ = ("_enum",)
+
     def __init__(
         self, enum: Type[EnumType], /, api_name: Optional[str] = None, **kwargs: Any
     ):
@@ -6,6 +6,7 @@ from typing import (
     Any,
     Awaitable,
     ClassVar,
+    Dict,
     Generic,
     Iterator,
     MutableMapping,
@@ -51,6 +52,8 @@ class BaseModule:
     instantiated.
     """
 
+    __slots__ = ("_original_data", "_updated_data")
+
     id = IdField()
 
     def __init__(self, **data: JsonType):
@@ -159,11 +162,23 @@ class BaseModule:
     @classmethod
     def field_names(cls) -> Iterator[str]:
         """Iterate over all requested field names."""
-        for key in dir(cls):
-            if key.startswith("_"):
-                continue
-            if isinstance(getattr(cls, key, None), Field):
-                yield key
+        # The result is cached in the class's own namespace (and not inherited), because
+        # subclasses may define additional fields.
+        field_names = cls.__dict__.get("_field_names")
+        if field_names is None:
+            # Walk the class hierarchy from the most generic class down, so that
+            # attributes overridden in a subclass replace the ones from their bases.
+            fields: Dict[str, bool] = {}
+            for base in reversed(cls.__mro__):
+                for key, value in vars(base).items():
+                    if key.startswith("_"):
+                        continue
+                    fields[key] = isinstance(value, Field)
+            field_names = tuple(
+                sorted(key for key, is_field in fields.items() if is_field)
+            )
+            setattr(cls, "_field_names", field_names)
+        return iter(field_names)
 
 
 class UnboundModule(BaseModule):
@@ -171,6 +186,8 @@ class UnboundModule(BaseModule):
     connected to a client yet.
     """
 
+    __slots__ = ()
+
 
 class BoundModule(Generic[ClientType], BaseModule, abc.ABC):
     """Bound modules are module classes are already scoped to a client and therefore
@@ -181,6 +198,8 @@ class BoundModule(Generic[ClientType], BaseModule, abc.ABC):
     saved, refreshed and deleted.
     """
 
+    __slots__ = ()
+
     _CLIENT_TYPE: ClassVar[Type[BaseClient]]
     _client: ClassVar[BaseClient]
     _api_name: ClassVar[str]
@@ -276,17 +295,19 @@ class BoundModule(Generic[ClientType], BaseModule, abc.ABC):
         # an existing record or creating a new one.
         record_id = self.get_data("id")
 
+        data: MutableJsonMapping
         if record_id is None:
-            data_keys = set(self._updated_data.keys()) | set(self._original_data.keys())
+            # Updated values take precedence over the original ones, same as when
+            # reading them through __getitem__().
+            data = {**self._original_data, **self._updated_data}
         else:
             # If the record is already present on the server, we only need to send the
             # updated data points.
-            data_keys = set(self._updated_data.keys())
+            data = dict(self._updated_data)
 
-        for key in data_keys:
+        for key in data:
             if key.startswith("_"):
                 raise ValueError(f"cannot save underscore-prefixed key {key!r}")
-        data = {key: self[key] for key in data_keys}
 
         if record_id is None:
             return "post", self._api_name, data
@@ -307,10 +328,9 @@ class BoundModule(Generic[ClientType], BaseModule, abc.ABC):
     def _finalize_delete(self) -> None:
         # Merge any updated data into the original data set (because we no longer have
         # a server-side record to match).
-        data_keys = set(self._updated_data.keys()) | set(self._original_data.keys())
-        self._original_data = {key: self.get_data(key) for key in data_keys}
-        if "id" in self._original_data:
-            del self._original_data["id"]
+        original_data = {**self._original_data, **self._updated_data}
+        original_data.pop("id", None)
+        self._original_data = original_data
         self._updated_data = {}
 
     def _finalize_refresh(self, record_data: JsonMapping) -> None:
@@ -373,6 +393,8 @@ class BoundModule(Generic[ClientType], BaseModule, abc.ABC):
 
 
 class SyncModule(BoundModule[SyncClient], abc.ABC):
+    __slots__ = ()
+
     _CLIENT_TYPE = SyncClient
 
     @classmethod
@@ -413,6 +435,8 @@ class SyncModule(BoundModule[SyncClient], abc.ABC):
 
 
 class AsyncModule(BoundModule[AsyncClient], abc.ABC):
+    __slots__ = ()
+
     _CLIENT_TYPE = AsyncClient
 
     @classmethod
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import sys
 from contextlib import contextmanager
 from functools import cached_property
@@ -9,9 +10,9 @@ from typing import (
     Any,
     AsyncIterator,
     Awaitable,
+    ClassVar,
     Dict,
     Generic,
-    Iterable,
     Iterator,
     List,
     Mapping,
@@ -43,6 +44,17 @@ OptionalGetReturn = TypeVar("OptionalGetReturn", covariant=True)
 Self = TypeVar("Self", bound="View[Any, Any, Any]")
 
 
+def _is_empty_slice(item: slice) -> bool:
+    """Check whether a slice selects nothing, no matter how long the sliced sequence
+    is."""
+    start: Optional[int] = item.start
+    stop: Optional[int] = item.stop
+    step: int = 1 if item.step is None else item.step
+    if start is None or stop is None or step == 0 or (start < 0) != (stop < 0):
+        return False
+    return start >= stop if step > 0 else start <= stop
+
+
 class View(Generic[ModuleType, GetReturn, OptionalGetReturn], abc.ABC):
     """Generic view class.
 
@@ -52,6 +64,10 @@ class View(Generic[ModuleType, GetReturn, OptionalGetReturn], abc.ABC):
     are returned from the abstract methods.
     """
 
+    # Number of records that are requested at once when iterating over a view. This
+    # matches Sugar's default for the max_num parameter.
+    _page_size: ClassVar[int] = 20
+
     def __init__(self, module: Type[ModuleType], base_endpoint: str = ""):
         """Build a new view.
 
@@ -178,7 +194,13 @@ class View(Generic[ModuleType, GetReturn, OptionalGetReturn], abc.ABC):
                 raise TypeError("module views only support slicing by integers")
 
             with self._clone() as view:
-                view._pending_slices.append(item)
+                if _is_empty_slice(item):
+                    # Nothing is left of the view, regardless of its size. Settling
+                    # the range right away means that the size is never fetched.
+                    view._range = range(0)
+                    view._pending_slices.clear()
+                else:
+                    view._pending_slices.append(item)
 
             return view
 
@@ -270,39 +292,69 @@ class View(Generic[ModuleType, GetReturn, OptionalGetReturn], abc.ABC):
     ) -> Union[ModuleType, Tuple[str, str, Mapping[str, str]]]:
         if (cache_entry := self._record_cache.get(offset, None)) is not None:
             return cache_entry
+        preparation = self._prepare_get_page(offset, 1)
+        assert isinstance(preparation, tuple)
+        return preparation
+
+    def _finalize_get_by_offset(
+        self, offset: int, data: JsonMapping
+    ) -> Optional[ModuleType]:
+        return self._finalize_get_page(offset, 1, data)[0]
+
+    def _prepare_get_page(
+        self, offset: int, limit: int
+    ) -> Union[Sequence[Optional[ModuleType]], Tuple[str, str, Mapping[str, str]]]:
+        """Prepare fetching a contiguous block of records, starting at the given
+        server-side offset.
+
+        If all the requested records are already cached, they are returned directly.
+        Otherwise, this returns a tuple containing an HTTP method, an endpoint and
+        query parameters for the request. The response should then be passed to
+        :meth:`_finalize_get_page`.
+        """
+        cached_records = [
+            self._record_cache.get(offset + index, None) for index in range(limit)
+        ]
+        if all(record is not None for record in cached_records):
+            return cached_records
 
         return (
             "get",
             # https://support.sugarcrm.com/Documentation/Sugar_Developer/Sugar_Developer_Guide_11.1/Integration/Web_Services/REST_API/Endpoints/module_GET/
             f"{self._base_endpoint}",
             dict(
-                max_num="1",
+                max_num=str(limit),
                 offset=str(offset),
                 **self._query_params,
             ),
         )
 
-    def _finalize_get_by_offset(
-        self, offset: int, data: JsonMapping
-    ) -> Optional[ModuleType]:
+    def _finalize_get_page(
+        self, offset: int, limit: int, data: JsonMapping
+    ) -> Sequence[Optional[ModuleType]]:
+        """Build (and cache) the records from a response that was prepared by
+        :meth:`_prepare_get_page`.
+
+        The result has one entry for each requested offset. Offsets that the server
+        didn't return a record for are ``None``.
+        """
         if "records" not in data or not isinstance(data["records"], Sequence):
             raise InvalidSugarResponseError(
                 "records filter request did not return any data"
             )
-        if len(data["records"]) > 1:
+        if len(data["records"]) > limit:
             raise InvalidSugarResponseError(
-                f"requested a single record but got more that one response"
+                f"requested at most {limit} records but got {len(data['records'])}"
             )
 
-        if len(data["records"]) == 0:
-            record = None
-        else:
-            record_data = data["records"][0]
+        records: List[Optional[ModuleType]] = [None] * limit
+        for index, record_data in enumerate(data["records"]):
             if not isinstance(record_data, Mapping):
                 raise InvalidSugarResponseError("got invalid record data")
-            record = self._module(**record_data)
-        self._record_cache[offset] = record
-        return record
+            records[index] = self._module(**record_data)
+        for index, record in enumerate(records):
+            self._record_cache[offset + index] = record
+        return records
 
     @abc.abstractmethod
     def _get_by_offset(self, offset: int) -> OptionalGetReturn:
@@ -343,6 +395,28 @@ class View(Generic[ModuleType, GetReturn, OptionalGetReturn], abc.ABC):
         except IndexError:
             return None
 
+    def _open_range(self) -> Optional[range]:
+        """Apply the pending slices to an unbounded range, without knowing the size.
+
+        For views that only go forward from some non-negative offset, the total number
+        of records doesn't change which offsets are targeted - only where the view ends.
+        Those can be iterated by fetching pages until the server runs out of records,
+        which saves the ``/count`` request. For all other views (those that count from
+        the end or go backwards), this returns ``None``.
+        """
+        if self._range is not None or self._size is not None:
+            return None
+        result = range(0, sys.maxsize)
+        for item in self._pending_slices:
+            if item.step is not None and item.step < 0:
+                return None
+            if (item.start is not None and item.start < 0) or (
+                item.stop is not None and item.stop < 0
+            ):
+                return None
+            result = result[item]
+        return result
+
     def _offset_to_index(self, offset: int) -> Optional[int]:
         try:
             assert isinstance(self._range, range), "view range has not been calculated"
@@ -357,7 +431,7 @@ class View(Generic[ModuleType, GetReturn, OptionalGetReturn], abc.ABC):
             **self._filter_query_params,
         }
 
-    @property
+    @cached_property
     def _filter_query_params(self) -> Mapping[str, str]:
         """Render out the current filter into query parameters.
 
@@ -378,34 +452,41 @@ class View(Generic[ModuleType, GetReturn, OptionalGetReturn], abc.ABC):
         ...     "c[d]": 4,
         ... }
 
-        The result can be passed to an HTTP library to use as query parameters.
+        The result can be passed to an HTTP library to use as query parameters. It is
+        computed once per view, since a view's filter doesn't change after it has been
+        created.
         """
         if self._filter is None:
             return {}
 
         params: MutableMapping[str, str] = {}
 
-        def parse_filter(prefix: str, filter_definition: JsonType) -> None:
-            """Recursively parse a filter definition and add the appropriate parameters
-            to the result object."""
+        # Walk the filter definition depth-first, keeping track of the path segments
+        # that lead to each value. They are only joined once a leaf is reached.
+        # Children are pushed in reverse so that parameters are emitted in the same
+        # order as they appear in the definition.
+        stack: List[Tuple[Tuple[str, ...], JsonType]] = [
+            ((), [self._filter.build_filter()])
+        ]
+        while stack:
+            path, filter_definition = stack.pop()
+
             if isinstance(filter_definition, (str, int, float, bool)):
-                params["filter{}".format(prefix)] = str(filter_definition)
-                return
+                params["filter" + "".join(path)] = str(filter_definition)
+                continue
 
-            iterator: Iterable[Tuple[str, JsonType]]
+            items: List[Tuple[Any, JsonType]]
             if isinstance(filter_definition, Mapping):
-                iterator = filter_definition.items()
+                items = list(filter_definition.items())
             elif isinstance(filter_definition, Sequence):
-                iterator = enumerate(filter_definition)  # type: ignore
+                items = list(enumerate(filter_definition))
             else:
                 raise TypeError(
                     f"invalid filter definition type: {type(filter_definition)}"
                 )
 
-            for key, value in iterator:
-                parse_filter(f"{prefix}[{key}]", value)
-
-        parse_filter("", [self._filter.build_filter()])
+            for key, value in reversed(items):
+                stack.append(((*path, f"[{key}]"), value))
 
         return params
 
@@ -424,26 +505,55 @@ class SyncView(
         return len(self._range)
 
     def __iter__(self) -> Iterator[SyncModuleType]:
-        self._calculate_range()
-        assert isinstance(self._range, range)
-        iterator = iter(self._range)
-        current_offset, next_offset = next(iterator, None), next(iterator, None)
-
-        while current_offset is not None:
-            # TODO Things this approach is currently missing:
-            #  - Batching. At the moment, this will send a request to the server for
-            #    each requested record. The batching implementation should also respect
-            #    reversed ranges (when using reversed() or something like [::-1] on the
-            #    view).
-            #  - Dynamically determining view size, which would nullify the need for
-            #    calling '/count' beforehand (which happens in __len__() in
-            #    _validate_range()). This is probably only feasible for forward
-            #    iteration though.
-            record = self._get_by_offset(current_offset)
-            if record is not None:
+        # When the view's end doesn't matter for which offsets it contains, iteration
+        # simply stops at the first missing record. Otherwise the range needs the total
+        # size, which is fetched from the server.
+        offsets = self._open_range()
+        bounded = offsets is None
+        if offsets is None:
+            self._calculate_range()
+            offsets = self._range
+        assert isinstance(offsets, range)
+
+        if abs(offsets.step) != 1:
+            # Views with larger steps only contain some of the records in any given
+            # block, so they are fetched individually.
+            for offset in offsets:
+                record = self._get_by_offset(offset)
+                if record is not None:
+                    yield record
+                elif not bounded:
+                    return
+            return
+
+        # For contiguous views, records are fetched in pages. Reversed views request the
+        # same blocks as forward ones (going backwards) and then flip each one locally.
+        for page_start in range(0, len(offsets), self._page_size):
+            page_offsets = offsets[page_start : page_start + self._page_size]
+            if bounded:
+                records = self._get_page(min(page_offsets), len(page_offsets))
+                if offsets.step < 0:
+                    records = records[::-1]
+                for record in records:
+                    if record is not None:
+                        yield record
+                continue
+
+            # Without a known size, one more record than needed is requested. If that
+            # one is missing, the server has run out of records and the first missing
+            # offset is the total size - without needing another (empty) page for it.
+            # That only holds when the record before it exists, though. A view that
+            # starts after the last record only tells us that the size is smaller.
+            records = self._get_page(page_offsets.start, len(page_offsets) + 1)
+            for offset, record in zip(page_offsets, records):
+                if record is None:
+                    if offset == 0 or offset > offsets.start:
+                        self._size = offset
+                    return
                 yield record
-
-            current_offset, next_offset = next_offset, next(iterator, None)
+            if records[-1] is None:
+                self._size = page_offsets.stop
+                return
 
     def __reversed__(self) -> Iterator[SyncModuleType]:
         return iter(self[::-1])
@@ -494,56 +604,31 @@ class SyncView(
         else:
             return preparation
 
+    def _get_page(self, offset: int, limit: int) -> Sequence[Optional[SyncModuleType]]:
+        preparation = self._prepare_get_page(offset, limit)
+        if isinstance(preparation, tuple):
+            method, endpoint, params = preparation
+            data = self._module.get_client().request(method, endpoint, params=params)
+            return self._finalize_get_page(offset, limit, data)
+        else:
+            return preparation
+
     def get_by_index(self, index: int) -> SyncModuleType:
         self._calculate_range()
 
         offset = self._index_to_offset(index)
         if offset is None:
             raise IndexError(index)
-        record = self._get_by_offset(offset)
+        if (record := self._record_cache.get(offset, None)) is None:
+            # Fetch the entire page around the requested offset so that neighbouring
+            # lookups are served from the cache.
+            page_start = offset - offset % self._page_size
+            record = self._get_page(page_start, self._page_size)[offset - page_start]
         if record is None:
             raise IndexError(index)
         return record
 
 
-class AsyncViewIterator(Generic[AsyncModuleType]):
-    def __init__(self, view: AsyncView[AsyncModuleType]):
-        self.view = view
-        self.current_index = 0
-        self.queue: List[Optional[AsyncModuleType]] = []
-
-    def __aiter__(self) -> AsyncIterator[AsyncModuleType]:
-        return self
-
-    async def _get_or_none(self, index_offset: int) -> Optional[AsyncModuleType]:
-        try:
-            return await self.view[self.current_index + index_offset]
-        except IndexError:
-            return None
-
-    async def __anext__(self) -> AsyncModuleType:
-        if len(self.queue) == 0:
-            # Note: this implementation definitely isn't perfect yet and does introduce
-            # some rather ugly database strain (since Sugar probably doesn't batch these
-            # in some smart manner and just sends of 6 requests). But it's still only
-            # one HTTP request, so it's better than fetching records individually.
-            new_records = await self.view._module.get_client().bulk(
-                self._get_or_none(0),
-                self._get_or_none(1),
-                self._get_or_none(2),
-                self._get_or_none(3),
-                self._get_or_none(4),
-                self._get_or_none(5),
-            )
-            self.queue.extend(new_records)
-            self.current_index += 6
-        record = self.queue.pop(0)
-        if record is None:
-            raise StopAsyncIteration
-        else:
-            return record
-
-
 class AsyncView(
     Generic[AsyncModuleType],
     View[
@@ -552,11 +637,92 @@ class AsyncView(
         Awaitable[Optional[AsyncModuleType]],
     ],
 ):
-    def __aiter__(self) -> AsyncIterator[AsyncModuleType]:
-        return AsyncViewIterator(self)
+    async def __aiter__(self) -> AsyncIterator[AsyncModuleType]:
+        # This follows SyncView.__iter__, see there for details.
+        offsets = self._open_range()
+        bounded = offsets is None
+        if offsets is None:
+            await self._calculate_range()
+            offsets = self._range
+        assert isinstance(offsets, range)
+
+        client = self._module.get_client()
+
+        if abs(offsets.step) != 1:
+            # Records are fetched individually here, so a batch of them is requested
+            # together using the bulk API.
+            for batch_start in range(0, len(offsets), self._page_size):
+                batch_offsets = offsets[batch_start : batch_start + self._page_size]
+                batch: Tuple[Optional[AsyncModuleType], ...] = await client.bulk(
+                    *(self._get_by_offset(offset) for offset in batch_offsets)
+                )
+                for record in batch:
+                    if record is not None:
+                        yield record
+                    elif not bounded:
+                        return
+            return
+
+        # Inside of a bulk() call, requests are only sent once every action is waiting
+        # on one. A request from a background task wouldn't be accounted for there,
+        # so pages are only prefetched outside of bulk contexts.
+        prefetch = client._handle_bulk is None
+
+        def fetch_page(
+            page_start: int,
+        ) -> Awaitable[Sequence[Optional[AsyncModuleType]]]:
+            page_offsets = offsets[page_start : page_start + self._page_size]
+            return self._get_page(
+                min(page_offsets), len(page_offsets) + (0 if bounded else 1)
+            )
+
+        # While the records of one page are being consumed, the next page is already
+        # requested in the background.
+        next_page: Optional[asyncio.Future[Sequence[Optional[AsyncModuleType]]]] = (
+            asyncio.ensure_future(fetch_page(0))
+            if len(offsets) > 0 and prefetch
+            else None
+        )
+        try:
+            for page_start in range(0, len(offsets), self._page_size):
+                if next_page is not None:
+                    records = await next_page
+                    next_page = None
+                else:
+                    records = await fetch_page(page_start)
+                if (
+                    prefetch
+                    and page_start + self._page_size < len(offsets)
+                    and (bounded or records[-1] is not None)
+                ):
+                    next_page = asyncio.ensure_future(
+                        fetch_page(page_start + self._page_size)
+                    )
+
+                page_offsets = offsets[page_start : page_start + self._page_size]
+                if bounded:
+                    if offsets.step < 0:
+                        records = records[::-1]
+                    for record in records:
+                        if record is not None:
+                            yield record
+                    continue
+
+                for offset, record in zip(page_offsets, records):
+                    if record is None:
+                        if offset == 0 or offset > offsets.start:
+                            self._size = offset
+                        return
+                    yield record
+                if records[-1] is None:
+                    self._size = page_offsets.stop
+                    return
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
     def __reversed__(self) -> AsyncIterator[AsyncModuleType]:
-        return AsyncViewIterator(self[::-1])
+        return self[::-1].__aiter__()
 
     async def length(self) -> int:
         await self._calculate_range()
@@ -632,12 +798,28 @@ class AsyncView(
         else:
             return preparation
 
+    async def _get_page(
+        self, offset: int, limit: int
+    ) -> Sequence[Optional[AsyncModuleType]]:
+        preparation = self._prepare_get_page(offset, limit)
+        if isinstance(preparation, tuple):
+            method, endpoint, params = preparation
+            data = await self._module.get_client().request(
+                method, endpoint, params=params
+            )
+            return self._finalize_get_page(offset, limit, data)
+        else:
+            return preparation
+
     async def get_by_index(self, index: int) -> AsyncModuleType:
         await self._calculate_range()
         offset = self._index_to_offset(index)
         if offset is None:
             raise IndexError(index)
-        record = await self._get_by_offset(offset)
+        if (record := self._record_cache.get(offset, None)) is None:
+            page_start = offset - offset % self._page_size
+            records = await self._get_page(page_start, self._page_size)
+            record = records[offset - page_start]
         if record is None:
             raise IndexError(index)
         return record
@@ -1,4 +1,16 @@
-from typing import TYPE_CHECKING, Any, Mapping, MutableMapping, Sequence, TypeVar, Union
+import importlib
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 if TYPE_CHECKING:
     # TypeGuard is new in Python 3.10, and we are targeting 3.8+. In order to keep the
@@ -15,6 +27,9 @@ __all__ = [
     "is_json_primitive",
     "is_json_mapping",
     "is_json",
+    "dump_json",
+    "dump_json_bytes",
+    "load_json",
 ]
 
 
@@ -63,3 +78,98 @@ def is_json(value: Any) -> "TypeGuard[JsonType]":
         return True
     else:
         return False
+
+
+_JsonDumper = Callable[[JsonType], str]
+_JsonBytesDumper = Callable[[JsonType], bytes]
+_JsonLoader = Callable[[Union[bytes, str]], Any]
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"invalid JSON constant: {name}")
+
+
+def _std_dumps(value: JsonType) -> str:
+    # The options are chosen to match what orjson does by default (see below).
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+def _std_dumps_bytes(value: JsonType) -> bytes:
+    return _std_dumps(value).encode()
+
+
+def _std_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data, parse_constant=_reject_constant)
+
+
+def _find_json_implementation() -> Tuple[_JsonDumper, _JsonBytesDumper, _JsonLoader]:
+    """Pick the functions used for encoding and decoding JSON.
+
+    `orjson`_ is used if it is installed (``pip install zucker[orjson]``), because it
+    is considerably faster than the standard library. It is an optional dependency,
+    which is why it is imported dynamically here. Both implementations are set up
+    to behave the same way:
+
+    - ``NaN`` and infinite floats are rejected with a :exc:`ValueError` when
+      encoding and ``NaN`` / ``Infinity`` aren't accepted when decoding, because
+      they aren't valid JSON.
+    - Non-string keys (integers, floats, booleans and ``None``) are converted to
+      strings, like the standard library does.
+    - Values orjson can't encode (like integers larger than 64 bits) and documents
+      it can't decode are handed to the standard library instead.
+
+    The only remaining difference is that orjson decodes integers larger than 64
+    bits into floats.
+
+    .. _orjson: https://github.com/ijl/orjson
+    """
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError:
+        return _std_dumps, _std_dumps_bytes, _std_loads
+
+    def dumps_bytes(value: JsonType) -> bytes:
+        try:
+            result: bytes = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return _std_dumps_bytes(value)
+        # orjson writes NaN and infinite floats as null instead of rejecting them. So
+        # when the output contains a null, the value is encoded with the standard
+        # library as well, which raises the error if there is one.
+        if b"null" in result:
+            _std_dumps(value)
+        return result
+
+    def dumps(value: JsonType) -> str:
+        return dumps_bytes(value).decode()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # This yields the same result (or error) as without orjson, for example
+            # for floats that overflow.
+            return _std_loads(data)
+
+    return dumps, dumps_bytes, loads
+
+
+_dump_json, _dump_json_bytes, _load_json = _find_json_implementation()
+
+
+def dump_json(value: JsonType) -> str:
+    """Encode the given object into a JSON string."""
+    return _dump_json(value)
+
+
+def dump_json_bytes(value: JsonType) -> bytes:
+    """Encode the given object into a UTF-8 encoded JSON document."""
+    return _dump_json_bytes(value)
+
+
+def load_json(data: Union[bytes, str]) -> JsonType:
+    """Decode a JSON document, which may be given either as text or as UTF-8 encoded
+    bytes.
+    """
+    result: JsonType = _load_json(data)
+    return result